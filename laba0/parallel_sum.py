@@ -0,0 +1,154 @@
+"""
+parallel_sum.py
+Параллельная редукция (суммирование) большого типизированного буфера.
+
+Данные лежат в разделяемой памяти (multiprocessing.shared_memory) или в
+двоичном файле, который каждый рабочий процесс отображает через mmap.
+В пул передаются только имя буфера и границы среза, сами элементы не
+сериализуются (pickle) и не копируются между процессами.
+
+Функции:
+- share_array(data, typecode)       — копирует данные в разделяемую память
+- parallel_sum(shm, length, ...)    — сумма буфера в разделяемой памяти
+- parallel_sum_file(path, ...)      — сумма двоичного файла через mmap
+- benchmark(sizes, max_workers)     — масштабирование 1..N ядер против sum_array
+"""
+
+import array
+import mmap
+import os
+import random
+import timeit
+from multiprocessing import Pool
+from multiprocessing import shared_memory
+
+from sum_analysis import CHUNK_SIZE, _reduce_chunk, sum_array
+
+
+def share_array(data, typecode="q"):
+    """Создаёт блок разделяемой памяти и копирует в него data.
+    Возвращает (SharedMemory, количество элементов).
+    Вызывающий код отвечает за shm.close() и shm.unlink().
+    Сложность: O(N).
+    """
+    buf = data if isinstance(data, array.array) else array.array(typecode, data)
+    nbytes = max(len(buf) * buf.itemsize, 1)  # блок нулевого размера создать нельзя
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    shm.buf[:len(buf) * buf.itemsize] = buf.tobytes()
+    return shm, len(buf)
+
+
+def _sum_view(items, start, stop):
+    """Сумма items[start:stop] блоками по CHUNK_SIZE тем же ядром, что и sum_stream."""
+    total = 0
+    for pos in range(start, stop, CHUNK_SIZE):
+        with items[pos:min(pos + CHUNK_SIZE, stop)] as chunk:
+            total += _reduce_chunk(chunk)
+    return total
+
+
+def _slice_sum_shared(task):
+    """Рабочая функция: подключается к блоку по имени и суммирует свой срез."""
+    name, typecode, start, stop = task
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast("B") as raw, raw.cast(typecode) as items:
+            return _sum_view(items, start, stop)
+    finally:
+        shm.close()
+
+
+def _slice_sum_file(task):
+    """Рабочая функция: отображает файл в память и суммирует свой срез."""
+    path, typecode, start, stop = task
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as raw, raw.cast(typecode) as items:
+            return _sum_view(items, start, stop)
+
+
+def _split(length, parts):
+    """Делит [0, length) на parts почти равных полуинтервалов."""
+    step, extra = divmod(length, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        stop = start + step + (1 if i < extra else 0)
+        if stop > start:
+            bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _run(worker, source, typecode, length, workers, pool):
+    """Раздаёт срезы пулу и складывает частичные суммы."""
+    if length == 0:
+        return 0
+    if pool is None:
+        workers = workers or os.cpu_count() or 1
+    else:
+        workers = workers or pool._processes
+    # несколько срезов на процесс сглаживают неравномерную загрузку ядер
+    tasks = [(source, typecode, start, stop)
+             for start, stop in _split(length, workers * 4)]
+    if pool is not None:
+        return sum(pool.map(worker, tasks))
+    with Pool(workers) as own_pool:
+        return sum(own_pool.map(worker, tasks))
+
+
+def parallel_sum(shm, length, typecode="q", workers=None, pool=None):
+    """Параллельная сумма length элементов типа typecode из разделяемой памяти.
+    shm — объект SharedMemory или его имя. Если pool не передан, создаётся
+    временный пул из workers процессов (по умолчанию — число ядер).
+    Сложность: O(N / P) по времени на P ядрах + O(P) на объединение.
+    """
+    name = shm if isinstance(shm, str) else shm.name
+    return _run(_slice_sum_shared, name, typecode, length, workers, pool)
+
+
+def parallel_sum_file(path, typecode="q", workers=None, pool=None):
+    """Параллельная сумма двоичного файла из элементов типа typecode.
+    Каждый процесс сам отображает файл в память — страничный кэш общий.
+    """
+    itemsize = array.array(typecode).itemsize
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError("размер файла не кратен размеру элемента")
+    return _run(_slice_sum_file, os.fspath(path), typecode, size // itemsize, workers, pool)
+
+
+def benchmark(sizes, max_workers=None, repeats=3):
+    """Сравнивает sum_array (один поток) с parallel_sum на 1..max_workers ядрах.
+    Пул создаётся заранее и прогревается, поэтому в замер попадает только редукция.
+    Возвращает словарь {размер: {"sum_array": t, 1: t, 2: t, ...}} (секунды).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    results = {}
+    for size in sizes:
+        data = [random.randint(1, 1000) for _ in range(size)]
+        expected = sum_array(data)
+        row = {"sum_array": min(timeit.repeat(lambda: sum_array(data), number=1, repeat=repeats))}
+        shm, length = share_array(data)
+        try:
+            for workers in range(1, max_workers + 1):
+                with Pool(workers) as pool:
+                    assert parallel_sum(shm, length, pool=pool) == expected
+                    row[workers] = min(timeit.repeat(
+                        lambda: parallel_sum(shm, length, pool=pool), number=1, repeat=repeats))
+        finally:
+            shm.close()
+            shm.unlink()
+        results[size] = row
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [10 ** 5, 10 ** 6, 10 ** 7]
+    results = benchmark(sizes)
+    for size, row in results.items():
+        base = row["sum_array"]
+        print(f"N={size}: sum_array {base * 1000:.2f} мс")
+        for workers, t in row.items():
+            if workers == "sum_array":
+                continue
+            print(f"  {workers:>2} процесс(ов): {t * 1000:8.2f} мс, ускорение x{base / t:.2f}")
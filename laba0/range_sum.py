@@ -0,0 +1,196 @@
+"""
+range_sum.py
+Индексы для многократных запросов «сумма элементов i..j» по одним и тем же
+данным. Вызов sum_array на срезе стоит O(N) на запрос; здесь запрос — O(1)
+или O(log N).
+
+Классы:
+- PrefixSums  — статический массив префиксных сумм (данные только для чтения).
+- FenwickTree — дерево Фенвика (изменяемые данные, точечные обновления).
+
+Границы запросов включительные: range_sum(i, j) = arr[i] + ... + arr[j].
+После каждого метода указана асимптотическая сложность.
+"""
+
+import random
+import timeit
+from itertools import accumulate
+from typing import Iterable, List, Tuple
+
+from sum_analysis import sum_array
+
+
+def _check_range(i: int, j: int, n: int) -> None:
+    if not 0 <= i <= j < n:
+        raise IndexError(f"диапазон [{i}, {j}] вне массива длины {n}")
+
+
+class PrefixSums:
+    def __init__(self, data: Iterable[int]):
+        """Построение префиксных сумм. O(n)
+        prefix[k] — сумма первых k элементов, prefix[0] = 0.
+        """
+        self.prefix: List[int] = [0]
+        self.prefix.extend(accumulate(data))
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    def range_sum(self, i: int, j: int) -> int:
+        """Сумма элементов i..j. O(1)"""
+        _check_range(i, j, len(self))
+        return self.prefix[j + 1] - self.prefix[i]
+
+    def range_sum_many(self, queries: Iterable[Tuple[int, int]]) -> List[int]:
+        """Пакетный ответ на запросы (i, j). O(k) для k запросов"""
+        prefix = self.prefix
+        n = len(self)
+        result = []
+        append = result.append
+        for i, j in queries:
+            _check_range(i, j, n)
+            append(prefix[j + 1] - prefix[i])
+        return result
+
+
+class FenwickTree:
+    def __init__(self, data: Iterable[int] = ()):
+        """Построение дерева Фенвика за O(n) (без n отдельных обновлений).
+        tree[k] (k с 1) хранит сумму элементов (k - lowbit(k), k].
+        """
+        self.values: List[int] = list(data)
+        self._build()
+
+    def _build(self) -> None:
+        """Построение tree по values. O(n)"""
+        n = len(self.values)
+        tree = [0] + self.values
+        for k in range(1, n + 1):
+            parent = k + (k & -k)
+            if parent <= n:
+                tree[parent] += tree[k]
+        self.tree = tree
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _prefix(self, k: int) -> int:
+        """Сумма первых k элементов. O(log n)"""
+        tree = self.tree
+        total = 0
+        while k > 0:
+            total += tree[k]
+            k &= k - 1
+        return total
+
+    def _check_index(self, index: int) -> None:
+        n = len(self.values)
+        if not 0 <= index < n:
+            raise IndexError(f"индекс {index} вне массива длины {n}")
+
+    def add(self, index: int, delta: int) -> None:
+        """Прибавить delta к элементу index. O(log n)"""
+        self._check_index(index)
+        n = len(self.values)
+        self.values[index] += delta
+        tree = self.tree
+        k = index + 1
+        while k <= n:
+            tree[k] += delta
+            k += k & -k
+
+    def set(self, index: int, value: int) -> None:
+        """Присвоить элементу index значение value. O(log n)"""
+        self._check_index(index)  # до чтения values: отрицательный индекс недопустим
+        self.add(index, value - self.values[index])
+
+    def range_sum(self, i: int, j: int) -> int:
+        """Сумма элементов i..j. O(log n)"""
+        _check_range(i, j, len(self.values))
+        return self._prefix(j + 1) - self._prefix(i)
+
+    def range_sum_many(self, queries: Iterable[Tuple[int, int]]) -> List[int]:
+        """Пакетный ответ на запросы (i, j). O(k log n)"""
+        prefix = self._prefix
+        n = len(self.values)
+        result = []
+        append = result.append
+        for i, j in queries:
+            _check_range(i, j, n)
+            append(prefix(j + 1) - prefix(i))
+        return result
+
+    def add_many(self, updates: Iterable[Tuple[int, int]]) -> None:
+        """Пакет обновлений (index, delta).
+        Если обновлений не меньше n / log n, дерево дешевле перестроить целиком
+        за O(n + k), иначе — k точечных обновлений за O(k log n).
+        Индексы проверяются до любых изменений: при ошибке дерево не меняется.
+        """
+        updates = list(updates)
+        for index, _ in updates:
+            self._check_index(index)
+        n = len(self.values)
+        if len(updates) * max(n.bit_length(), 1) < n:
+            for index, delta in updates:
+                self.add(index, delta)
+            return
+        values = self.values
+        for index, delta in updates:
+            values[index] += delta
+        self._build()
+
+    def set_many(self, updates: Iterable[Tuple[int, int]]) -> None:
+        """Пакет присваиваний (index, value). Порядок внутри пакета сохраняется."""
+        pending = {}
+        for index, value in updates:
+            self._check_index(index)
+            pending[index] = value
+        self.add_many((index, value - self.values[index]) for index, value in pending.items())
+
+
+def benchmark(size: int = 100000, queries: int = 1000) -> dict:
+    """Сравнение sum_array на срезе с PrefixSums и FenwickTree (секунды на пакет)."""
+    data = [random.randint(1, 1000) for _ in range(size)]
+    ranges = []
+    for _ in range(queries):
+        i = random.randrange(size)
+        ranges.append((i, random.randrange(i, size)))
+    prefix = PrefixSums(data)
+    fenwick = FenwickTree(data)
+    return {
+        "sum_array": timeit.timeit(lambda: [sum_array(data[i:j + 1]) for i, j in ranges], number=1),
+        "PrefixSums": timeit.timeit(lambda: prefix.range_sum_many(ranges), number=1),
+        "FenwickTree": timeit.timeit(lambda: fenwick.range_sum_many(ranges), number=1),
+    }
+
+
+if __name__ == "__main__":
+    # Проверка корректности против sum_array
+    data = [random.randint(-100, 100) for _ in range(500)]
+    prefix = PrefixSums(data)
+    fenwick = FenwickTree(data)
+    for _ in range(200):
+        i = random.randrange(len(data))
+        j = random.randrange(i, len(data))
+        assert prefix.range_sum(i, j) == fenwick.range_sum(i, j) == sum_array(data[i:j + 1])
+    updates = [(random.randrange(len(data)), random.randint(-5, 5)) for _ in range(300)]
+    fenwick.add_many(updates)
+    for index, delta in updates:
+        data[index] += delta
+    assert fenwick.range_sum_many([(0, len(data) - 1), (10, 20)]) == [sum_array(data), sum_array(data[10:21])]
+    small = FenwickTree([1, 2, 3, 4])
+    for bad in ([(0, 10), (1, 10), (9, 1)], [(0, 1)] * 10 + [(-1, 1)]):
+        try:
+            small.add_many(bad)
+        except IndexError:
+            pass
+        assert small.range_sum(0, 3) == sum_array(small.values) == 10
+    try:
+        small.set_many([(-1, 100)])
+    except IndexError:
+        pass
+    assert small.values == [1, 2, 3, 4]
+    print("Все тесты успешно пройдены.")
+
+    for name, t in benchmark().items():
+        print(f"{name:>12}: {t * 1000:10.3f} мс на 1000 запросов")
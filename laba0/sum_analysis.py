@@ -1,7 +1,14 @@
 # sum_analysis.py
-import timeit
-import matplotlib.pyplot as plt
+import argparse
+import array
+import json
+import mmap
+import os
+import platform
 import random
+import stat
+import sys
+import timeit
 
 
 # Исходная простая задача
@@ -29,6 +36,168 @@ def sum_array(arr):
     # Общая сложность: O(1) + O(N) * O(1) + O(1) = O(N)
 
 
+# ПОТОКОВОЕ СУММИРОВАНИЕ
+# Для файлов с миллиардами чисел список целиком в память не помещается,
+# поэтому данные читаются блоками фиксированного размера и каждый блок
+# сворачивается векторизованным ядром (NumPy или встроенный sum по memoryview).
+CHUNK_SIZE = 1 << 16  # элементов в одном блоке
+
+_numpy = None  # модуль numpy, False — не установлен, None — ещё не загружали
+
+
+def _load_numpy():
+    """NumPy загружается при первом потоковом суммировании, а не при импорте
+    модуля: import sum_analysis ради sum_array остаётся быстрым.
+    NumPy необязателен: без него работает ядро на memoryview.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def _open_source(source, mode):
+    """Возвращает (поток, нужно_ли_закрывать) для пути, '-' (stdin) или файлового объекта."""
+    if source == "-":
+        return (sys.stdin.buffer if "b" in mode else sys.stdin), False
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, mode), True
+    return source, False
+
+
+def _text_chunks(stream, chunk_size):
+    """Генератор списков токенов из текстового потока.
+    Незавершённое число на границе блока переносится в следующий блок.
+    Память: O(chunk_size).
+    """
+    tail = stream.read(0)  # пустая строка нужного типа (str или bytes)
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        tokens = block.split()
+        tail = block[:0]
+        if tokens and not block[-1:].isspace():
+            tail = tokens.pop()
+        yield tokens
+    if tail:
+        yield [tail]
+
+
+def _binary_chunks(stream, typecode, chunk_size):
+    """Генератор memoryview-блоков по chunk_size элементов типа typecode.
+    Обычные файлы отображаются в память через mmap (без копирования),
+    для каналов (stdin) используется чтение в буфер.
+    """
+    itemsize = array.array(typecode).itemsize
+    mm = None
+    try:
+        fileno = stream.fileno()
+        info = os.fstat(fileno)
+    except (OSError, ValueError, AttributeError):
+        info = None
+    if info is not None and stat.S_ISREG(info.st_mode):
+        size = info.st_size
+        if size == 0:
+            return  # пустой обычный файл
+        try:
+            mm = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None  # не отображается в память — читаем в буфер
+    # у канала st_size == 0, поэтому для него всегда используется чтение в буфер
+
+    if mm is not None:
+        if size % itemsize:
+            mm.close()
+            raise ValueError("размер файла не кратен размеру элемента")
+        try:
+            with memoryview(mm) as view, view.cast(typecode) as items:
+                for start in range(0, len(items), chunk_size):
+                    with items[start:start + chunk_size] as chunk:
+                        yield chunk
+        finally:
+            mm.close()
+        return
+
+    block_bytes = chunk_size * itemsize
+    rest = b""
+    while True:
+        data = stream.read(block_bytes)
+        if not data:
+            break
+        data = rest + data
+        usable = len(data) - len(data) % itemsize
+        rest = data[usable:]
+        if usable:
+            with memoryview(data)[:usable] as raw, raw.cast(typecode) as chunk:
+                yield chunk
+    if rest:
+        raise ValueError("размер потока не кратен размеру элемента")
+
+
+def _reduce_chunk(chunk):
+    """Векторизованное ядро свёртки одного блока.
+    NumPy применяется там, где накопитель int64/float64 не может переполниться
+    на блоке (элементы до 4 байт или вещественные), иначе — встроенный sum.
+    """
+    np = _load_numpy() if isinstance(chunk, memoryview) else None
+    if np is not None:
+        if chunk.format in "fd":
+            return np.asarray(chunk).sum(dtype=np.float64).item()
+        if chunk.itemsize <= 4:
+            return np.asarray(chunk).sum(dtype=np.int64).item()
+    if isinstance(chunk, memoryview):
+        return sum(chunk)
+    return sum(map(int, chunk))
+
+
+def sum_stream(source="-", binary=False, typecode="i", chunk_size=CHUNK_SIZE):
+    """Потоковая сумма чисел из файла, stdin ('-') или файлового объекта.
+    Текстовый формат — целые числа, разделённые пробельными символами;
+    двоичный — плотный массив элементов типа typecode (как в модуле array).
+    Возвращает (сумма, количество элементов).
+    Сложность: O(N) по времени, O(chunk_size) по памяти.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size должен быть положительным")
+    stream, owned = _open_source(source, "rb")
+    try:
+        if binary:
+            chunks = _binary_chunks(stream, typecode, chunk_size)
+        else:
+            # ~8 байт на число в тексте — блок примерно того же числа элементов
+            chunks = _text_chunks(stream, chunk_size * 8)
+        total = 0
+        count = 0
+        for chunk in chunks:
+            total += _reduce_chunk(chunk)
+            count += len(chunk)
+        return total, count
+    finally:
+        if owned:
+            stream.close()
+
+
+def measure_stream(source="-", binary=False, typecode="i", chunk_size=CHUNK_SIZE):
+    """Запускает sum_stream и возвращает словарь с суммой, числом элементов,
+    временем (с) и пропускной способностью (элементов/с).
+    """
+    start_time = timeit.default_timer()
+    total, count = sum_stream(source, binary=binary, typecode=typecode, chunk_size=chunk_size)
+    elapsed = timeit.default_timer() - start_time
+    return {
+        "total": total,
+        "count": count,
+        "seconds": elapsed,
+        "elements_per_second": count / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
 # Функция для замера времени выполнения
 def measure_time(func, data):
     """Измеряет время выполнения функции в миллисекундах."""
@@ -38,45 +207,160 @@ def measure_time(func, data):
     return (end_time - start_time) * 1000  # Конвертация в миллисекунды
 
 
-# Характеристики ПК (заполнить своими данными)
-pc_info = """ 
- Характеристики ПК для тестирования: 
- - Процессор: AMD Ryzen 5 5560U @ 2.30GHz 
- - Оперативная память: 16 GB
- - ОС: Windows 11 
- - Python: 3.12.9 
- """
-print(pc_info)
+# Характеристики ПК определяются автоматически
+def _cpu_name():
+    """Название процессора для текущей ОС (или platform.processor())."""
+    system = platform.system()
+    try:
+        if system == "Linux":
+            with open("/proc/cpuinfo", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        elif system == "Darwin":
+            import subprocess
+            return subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"],
+                                  capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, ValueError):
+        pass
+    return platform.processor() or platform.machine() or "неизвестно"
+
+
+def _ram_bytes():
+    """Объём оперативной памяти в байтах или None, если определить не удалось."""
+    if hasattr(os, "sysconf"):
+        try:
+            return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (OSError, ValueError):
+            return None
+    if platform.system() == "Windows":
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+    return None
+
+
+def system_info():
+    """Словарь с характеристиками ПК: процессор, число ядер, ОЗУ, ОС, Python."""
+    ram = _ram_bytes()
+    return {
+        "cpu": _cpu_name(),
+        "cores": os.cpu_count(),
+        "ram_gb": round(ram / 2 ** 30, 1) if ram else None,
+        "os": f"{platform.system()} {platform.release()}",
+        "python": platform.python_version(),
+    }
+
+
+def format_system_info(info):
+    """Текстовый блок характеристик ПК в формате отчёта."""
+    ram = f"{info['ram_gb']} GB" if info["ram_gb"] else "неизвестно"
+    return (
+        " Характеристики ПК для тестирования:\n"
+        f" - Процессор: {info['cpu']} ({info['cores']} ядер)\n"
+        f" - Оперативная память: {ram}\n"
+        f" - ОС: {info['os']}\n"
+        f" - Python: {info['python']}"
+    )
+
 
 # Проведение экспериментов
-sizes = [1000, 5000, 10000, 50000, 100000, 500000]  # Размеры массивов
-times = []  # Время выполнения для каждого размера
-
-print("Замеры времени выполнения для алгоритма суммирования массива:")
-print("{:>10} {:>12} {:>15}".format("Размер (N)", "Время (мс)", "Время/N (мкс)"))
-
-for size in sizes:
-    # Генерация случайного массива заданного размера
-    data = [random.randint(1, 1000) for _ in range(size)]
-    # Замер времени выполнения (усреднение на 10 запусках)
-    execution_time = timeit.timeit(lambda: sum_array(data), number=10) * 1000 / 10
-    times.append(execution_time)
-    time_per_element = (execution_time * 1000) / size if size > 0 else 0  # мкс на элемент
-    print("{:>10} {:>12.4f} {:>15.4f}".format(size, execution_time, time_per_element))
-
-    # Построение графика
-plt.figure(figsize=(10, 6))
-plt.plot(sizes, times, 'bo-', label='Измеренное время')
-plt.xlabel('Размер массива (N)')
-plt.ylabel('Время выполнения (мс)')
-plt.title('Зависимость времени выполнения от размера массива\nСложность: O(N)')
-plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-plt.legend()
-plt.savefig('time_complexity_plot.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-# Дополнительный анализ: сравнение с теоретической оценкой
-print("\nАнализ результатов:")
-print("1. Теоретическая сложность алгоритма: O(N)")
-print("2. Практические замеры показывают линейную зависимость времени от N")
-print("3. Время на один элемент примерно постоянно (~{:.4f} мкс)".format(time_per_element))
\ No newline at end of file
+def run_experiments(sizes, number=10):
+    """Замеряет sum_array на случайных массивах заданных размеров.
+    Возвращает список словарей {size, time_ms, time_per_element_us}.
+    """
+    results = []
+    for size in sizes:
+        # Генерация случайного массива заданного размера
+        data = [random.randint(1, 1000) for _ in range(size)]
+        # Замер времени выполнения (усреднение на number запусках)
+        execution_time = timeit.timeit(lambda: sum_array(data), number=number) * 1000 / number
+        time_per_element = (execution_time * 1000) / size if size > 0 else 0  # мкс на элемент
+        results.append({"size": size, "time_ms": execution_time,
+                        "time_per_element_us": time_per_element})
+    return results
+
+
+def plot_results(results, filename="time_complexity_plot.png", show=True):
+    """Строит график время(N). matplotlib импортируется только здесь."""
+    import matplotlib.pyplot as plt
+
+    sizes = [r["size"] for r in results]
+    times = [r["time_ms"] for r in results]
+    plt.figure(figsize=(10, 6))
+    plt.plot(sizes, times, 'bo-', label='Измеренное время')
+    plt.xlabel('Размер массива (N)')
+    plt.ylabel('Время выполнения (мс)')
+    plt.title('Зависимость времени выполнения от размера массива\nСложность: O(N)')
+    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
+    plt.legend()
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    if show:
+        plt.show()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Анализ производительности суммирования массива")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1000, 5000, 10000, 50000, 100000, 500000],
+                        help="размеры массивов для замеров")
+    parser.add_argument("--number", type=int, default=10, help="число запусков для усреднения")
+    parser.add_argument("--plot", metavar="PNG", nargs="?", const="time_complexity_plot.png",
+                        help="построить график и сохранить его в файл")
+    parser.add_argument("--show", action="store_true", help="показать окно с графиком")
+    parser.add_argument("--json", metavar="PATH", help="записать результаты в JSON")
+    parser.add_argument("--stream", metavar="FILE",
+                        help="вместо замеров просуммировать файл потоково ('-' — stdin)")
+    parser.add_argument("--binary", action="store_true", help="файл --stream двоичный")
+    parser.add_argument("--typecode", default="i", help="тип элементов двоичного файла (модуль array)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    info = system_info()
+    print(format_system_info(info))
+    report = {"system": info}
+
+    if args.stream:
+        stats = measure_stream(args.stream, binary=args.binary, typecode=args.typecode)
+        print(f"\nСумма: {stats['total']} ({stats['count']} элементов) за {stats['seconds']:.3f} с, "
+              f"{stats['elements_per_second']:.0f} элементов/с")
+        report["stream"] = stats
+    else:
+        print("\nЗамеры времени выполнения для алгоритма суммирования массива:")
+        print("{:>10} {:>12} {:>15}".format("Размер (N)", "Время (мс)", "Время/N (мкс)"))
+        results = run_experiments(args.sizes, args.number)
+        for r in results:
+            print("{:>10} {:>12.4f} {:>15.4f}".format(r["size"], r["time_ms"], r["time_per_element_us"]))
+        report["results"] = results
+
+        if args.plot or args.show:
+            plot_results(results, args.plot or "time_complexity_plot.png", show=args.show)
+
+        # Дополнительный анализ: сравнение с теоретической оценкой
+        if results:
+            print("\nАнализ результатов:")
+            print("1. Теоретическая сложность алгоритма: O(N)")
+            print("2. Практические замеры показывают линейную зависимость времени от N")
+            print("3. Время на один элемент примерно постоянно (~{:.4f} мкс)".format(
+                results[-1]["time_per_element_us"]))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты сохранены в {args.json}")
+
+
+if __name__ == "__main__":
+    main()
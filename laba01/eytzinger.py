@@ -0,0 +1,144 @@
+"""
+eytzinger.py
+Статический индекс поиска в раскладке Эйтцингера (BFS-порядок).
+
+Отсортированные ключи хранятся в компактном буфере array в порядке обхода
+дерева в ширину: корень в ячейке 1, потомки узла k — в ячейках 2k и 2k+1.
+Первые уровни дерева, через которые проходит каждый поиск, лежат в памяти
+подряд и остаются в кэше, а спуск k = 2k + (key < x) не содержит ветвлений
+по результату сравнения. Для массивов 10^7+ это заметно уменьшает число
+промахов кэша по сравнению с прыжками binary_search по обычному списку.
+
+search(x) возвращает индекс x в исходном отсортированном массиве или -1.
+При повторяющихся ключах это индекс первого вхождения (как у bisect_left и
+binary_search_many); binary_search в этом случае может вернуть любое из них,
+поэтому результаты совпадают только для уникальных ключей.
+
+Памяти — ровно один буфер ключей (n + 1 элементов): позиция ключа в
+отсортированном массиве не хранится, а вычисляется по номеру узла за O(1).
+"""
+
+import argparse
+import random
+import time
+from array import array
+from bisect import bisect_left
+
+from search_comparison import SIZES, binary_search
+
+
+class EytzingerIndex:
+    def __init__(self, sorted_keys, typecode: str = "q"):
+        """Построение индекса по отсортированной последовательности. O(n)
+        keys[k] — ключ узла k (k с 1, ячейка 0 не используется).
+        """
+        n = len(sorted_keys)
+        self.n = n
+        self.keys = array(typecode, bytes(array(typecode).itemsize * (n + 1)))
+        keys = self.keys
+        self._height = n.bit_length()  # число уровней дерева
+        # узлов на последнем (возможно, неполном) уровне
+        self._last = n - ((1 << (self._height - 1)) - 1) if n else 0
+        # итеративный симметричный обход неявного дерева 1..n
+        stack = []
+        k = 1
+        i = 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k <<= 1
+            k = stack.pop()
+            keys[k] = sorted_keys[i]
+            i += 1
+            k = (k << 1) | 1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _rank(self, k: int) -> int:
+        """Позиция узла k в отсортированном массиве (симметричный порядок). O(1)
+        В совершенном дереве высоты H узел k глубины d стоит на позиции
+        p = (2(k - 2^d) + 1)·2^(H-1-d) - 1; ячейки последнего уровня занимают
+        чётные позиции, поэтому вычитаем отсутствующие ячейки левее p.
+        """
+        d = k.bit_length() - 1
+        p = (((k - (1 << d)) << 1 | 1) << (self._height - 1 - d)) - 1
+        slots = (p + 1) >> 1  # ячеек последнего уровня левее p
+        return p - slots + min(slots, self._last)
+
+    def _lower_node(self, x) -> int:
+        """Узел с первым ключом >= x или 0, если такого нет. O(log n)"""
+        keys = self.keys
+        n = self.n
+        k = 1
+        while k <= n:
+            k = (k << 1) | (keys[k] < x)  # без ветвления по результату сравнения
+        # отбрасываем хвост из единиц (повороты вправо) и последний поворот влево
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, x) -> int:
+        """Индекс первого элемента >= x в отсортированном массиве (n, если нет). O(log n)"""
+        k = self._lower_node(x)
+        return self._rank(k) if k else self.n
+
+    def search(self, x) -> int:
+        """Индекс x в отсортированном массиве или -1. O(log n)"""
+        k = self._lower_node(x)
+        if k and self.keys[k] == x:
+            return self._rank(k)
+        return -1
+
+    def __contains__(self, x) -> bool:
+        return self.search(x) != -1
+
+
+def benchmark(sizes, queries: int = 10000) -> list:
+    """Среднее время одного запроса (мкс) для binary_search, bisect и EytzingerIndex.
+    Данные хранятся в array('q'), чтобы размеры до 10^8 помещались в память.
+    """
+    rows = []
+    for size in sizes:
+        arr = array("q", range(size))
+        index = EytzingerIndex(arr)
+        targets = [random.randrange(-1, size + 1) for _ in range(queries)]
+
+        start = time.perf_counter()
+        expected = [binary_search(arr, t) for t in targets]
+        t_binary = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for t in targets:
+            bisect_left(arr, t)
+        t_bisect = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = [index.search(t) for t in targets]
+        t_eytz = time.perf_counter() - start
+
+        assert got == expected  # ключи уникальны, индексы совпадают
+        rows.append({
+            "size": size,
+            "binary_search_us": t_binary / queries * 1e6,
+            "bisect_us": t_bisect / queries * 1e6,
+            "eytzinger_us": t_eytz / queries * 1e6,
+        })
+        del arr, index
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение binary_search, bisect и EytzingerIndex")
+    parser.add_argument("--max-size", type=int, default=10 ** 8,
+                        help="верхняя граница размеров (10^8 требует ~2.5 ГБ памяти)")
+    parser.add_argument("--queries", type=int, default=10000)
+    args = parser.parse_args()
+
+    sizes = [s for s in SIZES + [10 ** 7, 10 ** 8] if s <= args.max_size]
+    print(f"{'N':>10} {'binary_search':>14} {'bisect':>10} {'eytzinger':>10}  (мкс/запрос)")
+    for row in benchmark(sizes, args.queries):
+        print(f"{row['size']:>10} {row['binary_search_us']:>14.3f} "
+              f"{row['bisect_us']:>10.3f} {row['eytzinger_us']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+mmap_index.py
+Отсортированный индекс ключей на диске и поиск по нему через mmap.
+
+Формат файла:
+- заголовок (16 байт): сигнатура b"SIDX", версия, порядок байт ('<' или '>'),
+  тип элемента (typecode модуля array), число записей;
+- далее — отсортированные записи фиксированной ширины (itemsize байт).
+
+MmapSortedIndex отображает файл в память и выполняет binary_search прямо по
+отображённым байтам (memoryview, при чужом порядке байт — struct), без загрузки
+ключей в list. Открытие занимает O(1), а страницы файла находятся в общем
+страничном кэше ОС и разделяются всеми процессами, которые читают индекс.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+
+from search_comparison import binary_search, _binary_search_range
+
+MAGIC = b"SIDX"
+VERSION = 1
+HEADER = struct.Struct("<4sBcc1xQ")  # сигнатура, версия, порядок байт, тип, пропуск, число записей
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+WRITE_CHUNK = 1 << 16  # записей в одном блоке при записи
+
+
+def write_index(path, keys, typecode="q"):
+    """Записывает отсортированные keys в файл индекса блоками по WRITE_CHUNK.
+    keys может быть любым итерируемым объектом (в т.ч. генератором) —
+    целиком в памяти он не хранится. Порядок проверяется при записи.
+
+    Запись идёт во временный файл в том же каталоге, который после fsync
+    атомарно подменяет path (os.replace). Старый файл при этом не обрезается:
+    процессы, отобразившие его в память, дочитывают прежнюю версию, а при
+    ошибке (например, неотсортированных ключах) path остаётся нетронутым.
+    Возвращает число записей. Сложность: O(n) по времени, O(WRITE_CHUNK) по памяти.
+    """
+    block = array(typecode)
+    if block.itemsize != struct.calcsize("<" + typecode):
+        raise ValueError(f"тип {typecode!r} не имеет фиксированной ширины, используйте b/h/i/q/f/d")
+    count = 0
+    previous = None
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "xb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, NATIVE_ORDER.encode(), typecode.encode(), 0))
+            for key in keys:
+                if previous is not None and key < previous:
+                    raise ValueError(f"ключи не отсортированы: {key!r} после {previous!r}")
+                previous = key
+                block.append(key)
+                if len(block) == WRITE_CHUNK:
+                    block.tofile(f)
+                    count += len(block)
+                    del block[:]
+            block.tofile(f)
+            count += len(block)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, NATIVE_ORDER.encode(), typecode.encode(), count))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return count
+
+
+class _StructView:
+    """Последовательность записей с неродным порядком байт (чтение через struct)."""
+
+    def __init__(self, buf, fmt, count):
+        self.buf = buf
+        self.record = struct.Struct(fmt)
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("индекс записи вне индекса")
+        return self.record.unpack_from(self.buf, HEADER.size + index * self.record.size)[0]
+
+
+class MmapSortedIndex:
+    def __init__(self, path):
+        """Открывает файл индекса и отображает его в память. O(1)"""
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # пустой файл
+            self._file.close()
+            raise ValueError(f"{path}: не файл индекса")
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: не файл индекса")
+        magic, version, order, typecode, count = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: неизвестный формат индекса")
+        self.typecode = typecode.decode()
+        itemsize = struct.calcsize(order.decode() + self.typecode)
+        if len(self._mm) != HEADER.size + count * itemsize:
+            self.close()
+            raise ValueError(f"{path}: размер файла не совпадает с заголовком")
+        if order.decode() == NATIVE_ORDER:
+            self.keys = memoryview(self._mm)[HEADER.size:].cast(self.typecode)
+        else:
+            self.keys = _StructView(self._mm, order.decode() + self.typecode, count)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        return self.keys[index]
+
+    def search(self, target) -> int:
+        """Индекс target или -1 (семантика binary_search). O(log n)"""
+        return binary_search(self.keys, target)
+
+    def search_range(self, target, left, right) -> int:
+        """Поиск на отрезке записей [left, right]. O(log (right - left))"""
+        return _binary_search_range(self.keys, target, left, right)
+
+    def close(self) -> None:
+        """Освобождает отображение и файл. Повторный вызов безопасен."""
+        keys = getattr(self, "keys", None)
+        if isinstance(keys, memoryview):
+            keys.release()
+        if getattr(self, "_mm", None) is not None and not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _worker_queries(task):
+    """Рабочий процесс: открывает индекс сам и возвращает (время открытия, найдено)."""
+    path, targets = task
+    start = time.perf_counter()
+    with MmapSortedIndex(path) as index:
+        opened = time.perf_counter() - start
+        found = sum(index.search(t) != -1 for t in targets)
+    return opened, found
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    n = 10 ** 7
+    path = os.path.join(tempfile.gettempdir(), "sorted_keys.sidx")
+    start = time.perf_counter()
+    write_index(path, range(0, 2 * n, 2))
+    print(f"Индекс из {n} ключей записан за {time.perf_counter() - start:.2f} с "
+          f"({os.path.getsize(path) / 2 ** 20:.1f} МБ)")
+
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        f.seek(HEADER.size)
+        loaded = array("q")
+        loaded.frombytes(f.read())
+        loaded = loaded.tolist()
+    print(f"Загрузка в list: {time.perf_counter() - start:.3f} с")
+    del loaded
+
+    with MmapSortedIndex(path) as index:
+        for t in (0, 2, 2 * n - 2, 1, -5, 2 * n):
+            expected = t // 2 if 0 <= t < 2 * n and t % 2 == 0 else -1
+            assert index.search(t) == expected
+
+        # перезапись не трогает отображённый файл, неудачная — и сам path
+        small = os.path.join(tempfile.gettempdir(), "sorted_keys_small.sidx")
+        write_index(small, range(10))
+        with MmapSortedIndex(small) as old:
+            write_index(small, range(100, 105))
+            assert len(old) == 10 and old.search(9) == 9
+        try:
+            write_index(small, [3, 1, 2])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("неотсортированные ключи должны отклоняться")
+        with MmapSortedIndex(small) as new:
+            assert len(new) == 5 and new.search(104) == 4
+        assert not [name for name in os.listdir(tempfile.gettempdir())
+                    if name.startswith("sorted_keys_small.sidx.")]
+        os.remove(small)
+
+    workers = os.cpu_count() or 1
+    tasks = [(path, [random.randrange(2 * n) for _ in range(10000)]) for _ in range(workers)]
+    with Pool(workers) as pool:
+        for i, (opened, found) in enumerate(pool.map(_worker_queries, tasks)):
+            print(f"Процесс {i}: открытие {opened * 1000:.3f} мс, найдено {found} из 10000")
+    os.remove(path)
@@ -1,5 +1,21 @@
+import math
+import random
+import sys
 import time
-import matplotlib.pyplot as plt
+from bisect import bisect_left
+
+# Размеры массивов для замеров (общие для всех сравнений поиска)
+SIZES = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000]
+
+
+def _numpy_array(obj):
+    """Модуль numpy, если obj — ndarray, иначе None.
+    NumPy необязателен и сам не импортируется (импорт стоит ~0.1 с): ndarray
+    может прийти, только если вызывающий код уже загрузил numpy.
+    """
+    np = sys.modules.get("numpy")  # O(1)
+    return np if np is not None and isinstance(obj, np.ndarray) else None
+
 
 # -----------------------------
 # ЛИНЕЙНЫЙ ПОИСК
@@ -12,6 +28,62 @@ def linear_search(arr, target):  # O(1)
 # Общая сложность: O(n)
 
 
+# -----------------------------
+# ЛИНЕЙНЫЙ ПОИСК МНОГИХ КЛЮЧЕЙ ЗА ОДИН ПРОХОД
+# -----------------------------
+def _scan_chunk(chunk, offset, pending, found):  # O(1)
+    """Ищет ключи из pending в одном блоке и переносит найденные в found.
+    Векторизованные пути: np.isin для ndarray, bytes.find для байтовых буферов.
+    """
+    np = _numpy_array(chunk)  # O(1)
+    if np is not None:
+        keys = np.array(list(pending))  # O(k)
+        hits = np.flatnonzero(np.isin(chunk, keys))  # O(m log k) в C
+        values, first = np.unique(chunk[hits], return_index=True)  # первые вхождения
+        for value, pos in zip(values.tolist(), hits[first].tolist()):  # O(k)
+            found[value] = offset + pos  # O(1)
+            pending.discard(value)  # O(1)
+        return  # O(1)
+    if isinstance(chunk, (bytes, bytearray)):  # ключи — значения байтов 0..255
+        for key in list(pending):  # O(k)
+            if isinstance(key, int) and 0 <= key < 256:  # O(1)
+                pos = chunk.find(bytes((key,)))  # O(m) в C
+                if pos != -1:  # O(1)
+                    found[key] = offset + pos  # O(1)
+                    pending.discard(key)  # O(1)
+        return  # O(1)
+    for i, value in enumerate(chunk):  # O(m)
+        if value in pending:  # O(1) — поиск в множестве
+            found[value] = offset + i  # O(1)
+            pending.discard(value)  # O(1)
+            if not pending:  # O(1) — все ключи найдены
+                return  # O(1)
+
+
+def linear_search_many(data, targets, chunked=False):
+    """Индексы первых вхождений всех targets в неотсортированных данных за один проход.
+    Возвращает список индексов в порядке targets, -1 для отсутствующих.
+
+    data — последовательность, array, bytes или ndarray; при chunked=True —
+    итерируемый объект из блоков (например, читаемых из файла), индексы
+    считаются сквозными по всем блокам. Проход останавливается, как только
+    найдены все ключи, поэтому поток дальше не читается.
+    Сложность: O(n + k) вместо O(k * n) для k вызовов linear_search.
+    """
+    targets = list(targets)  # O(k)
+    pending = set(targets)  # O(k)
+    found = {}  # O(1)
+    chunks = data if chunked else (data,)  # O(1)
+    offset = 0  # O(1)
+    for chunk in chunks:  # O(n) суммарно
+        if not pending:  # O(1)
+            break  # O(1)
+        _scan_chunk(chunk, offset, pending, found)  # O(len(chunk))
+        offset += len(chunk)  # O(1)
+    return [found.get(t, -1) for t in targets]  # O(k)
+# Общая сложность: O(n + k)
+
+
 # -----------------------------
 # БИНАРНЫЙ ПОИСК
 # -----------------------------
@@ -29,6 +101,249 @@ def binary_search(arr, target):  # O(1)
 # Общая сложность: O(log n)
 
 
+# -----------------------------
+# ПАКЕТНЫЙ БИНАРНЫЙ ПОИСК
+# -----------------------------
+def binary_search_many(arr, targets):
+    """Ищет все targets в отсортированном arr за один вызов.
+    Возвращает список индексов (для NumPy-массивов — массив), -1 для отсутствующих.
+    При повторяющихся ключах возвращается индекс первого вхождения.
+
+    Запросы сортируются и обходятся по возрастанию: левая граница окна поиска
+    только сдвигается вправо, поэтому каждый следующий поиск идёт в сужающемся
+    окне [lo, n). Для ndarray используется векторизованный np.searchsorted.
+    Сложность: O(k log k + k log n), где k = len(targets).
+    """
+    np = _numpy_array(arr)  # O(1)
+    if np is not None:
+        keys = np.asarray(targets)
+        if len(arr) == 0:
+            return np.full(len(keys), -1)
+        idx = np.searchsorted(arr, keys)  # O(k log n) в C
+        found = arr[np.minimum(idx, len(arr) - 1)] == keys  # idx == n -> ключ больше всех
+        return np.where(found, idx, -1)
+
+    targets = list(targets)  # O(k)
+    n = len(arr)
+    result = [-1] * len(targets)
+    lo = 0
+    for pos in sorted(range(len(targets)), key=targets.__getitem__):  # O(k log k)
+        target = targets[pos]
+        lo = bisect_left(arr, target, lo, n)  # O(log n), окно сужается
+        if lo < n and arr[lo] == target:
+            result[pos] = lo
+    return result
+# Общая сложность: O(k log k + k log n)
+
+
+# -----------------------------
+# ИНТЕРПОЛЯЦИОННЫЙ ПОИСК
+# -----------------------------
+def interpolation_search(arr, target):
+    """Поиск в отсортированном массиве чисел с оценкой позиции по значению.
+    Возвращает индекс target или -1.
+    Сложность: O(log log n) для равномерно распределённых ключей, O(n) в худшем случае.
+    """
+    left, right = 0, len(arr) - 1  # O(1)
+    while left <= right:  # O(log log n) в среднем
+        lo_val, hi_val = arr[left], arr[right]  # O(1)
+        if target < lo_val or target > hi_val:  # O(1)
+            return -1  # O(1)
+        if lo_val == hi_val:  # O(1) — весь диапазон из одинаковых ключей
+            return left  # O(1)
+        # int(): для вещественных ключей оценка позиции — float; зажимаем в [left, right]
+        pos = left + int((target - lo_val) * (right - left) // (hi_val - lo_val))  # O(1)
+        pos = min(max(pos, left), right)  # O(1)
+        value = arr[pos]  # O(1)
+        if value == target:  # O(1)
+            return pos  # O(1)
+        elif value < target:  # O(1)
+            left = pos + 1  # O(1)
+        else:  # O(1)
+            right = pos - 1  # O(1)
+    return -1  # O(1)
+# Общая сложность: O(log log n) в среднем
+
+
+# -----------------------------
+# ЭКСПОНЕНЦИАЛЬНЫЙ (ГАЛОПИРУЮЩИЙ) ПОИСК
+# -----------------------------
+def _binary_search_range(arr, target, left, right):  # O(1)
+    """Бинарный поиск на отрезке [left, right]."""
+    while left <= right:  # O(log (right - left))
+        mid = (left + right) // 2  # O(1)
+        if arr[mid] == target:  # O(1)
+            return mid  # O(1)
+        elif arr[mid] < target:  # O(1)
+            left = mid + 1  # O(1)
+        else:  # O(1)
+            right = mid - 1  # O(1)
+    return -1  # O(1)
+
+
+def exponential_search(arr, target, finger=0):
+    """Галопирующий поиск от позиции finger (например, предыдущего найденного индекса).
+    Шаг удваивается (1, 2, 4, ...), пока target не окажется внутри окна,
+    затем выполняется бинарный поиск внутри окна.
+    Сложность: O(log d), где d — расстояние от finger до target.
+    """
+    n = len(arr)  # O(1)
+    if n == 0:  # O(1)
+        return -1  # O(1)
+    finger = min(max(finger, 0), n - 1)  # O(1)
+    value = arr[finger]  # O(1)
+    if value == target:  # O(1)
+        return finger  # O(1)
+    step = 1  # O(1)
+    if value < target:  # вправо от finger
+        left = finger + 1  # O(1)
+        while finger + step < n and arr[finger + step] < target:  # O(log d)
+            left = finger + step + 1  # O(1)
+            step *= 2  # O(1)
+        return _binary_search_range(arr, target, left, min(finger + step, n - 1))  # O(log d)
+    right = finger - 1  # влево от finger
+    while finger - step >= 0 and arr[finger - step] > target:  # O(log d)
+        right = finger - step - 1  # O(1)
+        step *= 2  # O(1)
+    return _binary_search_range(arr, target, max(finger - step, 0), right)  # O(log d)
+# Общая сложность: O(log d)
+
+
+# -----------------------------
+# АДАПТИВНЫЙ ПОИСК
+# -----------------------------
+class AdaptiveSearch:
+    """Выбирает самый дешёвый способ поиска для данного массива и потока запросов.
+
+    При создании по выборке из sample_size ключей оценивается, насколько
+    распределение близко к равномерному (отклонение от прямой arr[0]..arr[-1]).
+    Для равномерных числовых ключей базовая стратегия — интерполяционный поиск,
+    иначе — бинарный; её стоимость (среднее число проб) измеряется на той же
+    выборке. Если запросы приходят рядом с предыдущим попаданием (скользящая
+    оценка стоимости галопа меньше измеренной стоимости базовой стратегии),
+    используется экспоненциальный поиск от этой позиции.
+    """
+
+    def __init__(self, arr, sample_size=64, uniform_tolerance=0.01):
+        self.arr = arr  # O(1)
+        self.finger = 0  # O(1) — индекс последнего попадания
+        n = len(arr)  # O(1)
+        self.strategy = "binary"  # O(1)
+        if n > 2 and self._is_uniform(sample_size, uniform_tolerance):  # O(sample_size)
+            self.strategy = "interpolation"  # O(1)
+        self.base_cost = self._calibrate(sample_size)  # O(sample_size * T(n))
+        self.gallop_cost = self.base_cost  # O(1) — скользящая оценка 3*log2(d+1)+1
+
+    def _calibrate(self, sample_size):
+        """Среднее число проб базовой стратегии на ключах выборки.
+        Асимптотическая оценка (log log n для интерполяции) на практике сильно
+        расходится с числом проб, поэтому порог галопа берётся измеренный.
+        """
+        n = len(self.arr)  # O(1)
+        if n == 0:  # O(1)
+            return 1.0  # O(1)
+        counter = ProbeCounter(self.arr)  # O(1)
+        count = min(sample_size, n)  # O(1)
+        for j in range(count):  # O(sample_size * T(n))
+            target = self.arr[j * (n - 1) // max(count - 1, 1)]  # O(1)
+            if self.strategy == "interpolation":  # O(1)
+                interpolation_search(counter, target)  # O(log log n)
+            else:  # O(1)
+                binary_search(counter, target)  # O(log n)
+        return counter.probes / count  # O(1)
+
+    def _is_uniform(self, sample_size, tolerance):
+        """Максимальное отклонение выборки от линейной интерполяции, в долях диапазона."""
+        arr = self.arr  # O(1)
+        n = len(arr)  # O(1)
+        try:
+            first, last = arr[0], arr[-1]  # O(1)
+            span = last - first  # O(1)
+            if span <= 0:  # O(1)
+                return False  # O(1)
+            worst = 0.0  # O(1)
+            for j in range(1, sample_size + 1):  # O(sample_size)
+                i = j * (n - 1) // (sample_size + 1)  # O(1)
+                expected = first + span * i / (n - 1)  # O(1)
+                worst = max(worst, abs(arr[i] - expected) / span)  # O(1)
+        except TypeError:  # ключи не числа — интерполяция невозможна
+            return False  # O(1)
+        return worst <= tolerance  # O(1)
+
+    def search(self, target):
+        """Индекс target или -1 с выбором стратегии под текущий поток запросов."""
+        if self.gallop_cost < self.base_cost:  # O(1) — запросы локальны
+            result = exponential_search(self.arr, target, self.finger)  # O(log d)
+        elif self.strategy == "interpolation":  # O(1)
+            result = interpolation_search(self.arr, target)  # O(log log n)
+        else:  # O(1)
+            result = binary_search(self.arr, target)  # O(log n)
+        if result != -1:  # O(1)
+            distance = abs(result - self.finger)  # O(1)
+            # экспоненциальное сглаживание оценки стоимости галопа: проба finger,
+            # ~log2 d проб удвоения и ~2*log2 d проб (== и <) в бинарном поиске окна
+            self.gallop_cost = 0.75 * self.gallop_cost + 0.25 * (3 * math.log2(distance + 1) + 1)  # O(1)
+            self.finger = result  # O(1)
+        return result  # O(1)
+
+
+class ProbeCounter:
+    """Обёртка над последовательностью, считающая обращения arr[i] (пробы)."""
+
+    def __init__(self, arr):
+        self.arr = arr  # O(1)
+        self.probes = 0  # O(1)
+
+    def __len__(self):
+        return len(self.arr)  # O(1)
+
+    def __getitem__(self, index):
+        self.probes += 1  # O(1)
+        return self.arr[index]  # O(1)
+
+
+def compare_adaptive(size=1000000, queries=10000):
+    """Среднее число проб и время на запрос для бинарного, интерполяционного,
+    галопирующего и адаптивного поиска на равномерных и неравномерных ключах,
+    для случайных и локальных (рядом с предыдущим) запросов.
+    """
+    datasets = {
+        "равномерные": list(range(0, 3 * size, 3)),  # O(n)
+        "квадраты": [i * i for i in range(size)],  # O(n) — сильно неравномерные
+    }
+    rows = []  # O(1)
+    for data_name, arr in datasets.items():  # O(1)
+        random_targets = [arr[random.randrange(size)] for _ in range(queries)]  # O(q)
+        pos = size // 2  # O(1)
+        local_targets = []  # O(1)
+        for _ in range(queries):  # O(q) — блуждание с маленьким шагом
+            pos = min(max(pos + random.randint(-8, 8), 0), size - 1)  # O(1)
+            local_targets.append(arr[pos])  # O(1)
+        for pattern, targets in (("случайные", random_targets), ("локальные", local_targets)):
+            for name in ("binary", "interpolation", "exponential", "adaptive"):  # O(1)
+                counter = ProbeCounter(arr)  # O(1)
+                adaptive = AdaptiveSearch(counter)  # O(sample_size)
+                counter.probes = 0  # выборка при создании не входит в счёт запросов
+                finger = 0  # O(1)
+                start = time.perf_counter()  # O(1)
+                for t in targets:  # O(q * T(n))
+                    if name == "binary":
+                        r = binary_search(counter, t)
+                    elif name == "interpolation":
+                        r = interpolation_search(counter, t)
+                    elif name == "exponential":
+                        r = exponential_search(counter, t, finger)
+                        finger = r
+                    else:
+                        r = adaptive.search(t)
+                    assert r != -1 and arr[r] == t  # все ключи присутствуют
+                elapsed = time.perf_counter() - start  # O(1)
+                rows.append((data_name, pattern, name, counter.probes / queries,
+                             elapsed / queries * 1e6))  # O(1)
+    return rows
+# Общая сложность: O(n + q * log n)
+
+
 # -----------------------------
 # ФУНКЦИЯ ДЛЯ ЗАМЕРОВ ВРЕМЕНИ
 # -----------------------------
@@ -45,7 +360,11 @@ def measure_time(func, arr, target, repeats=5):  # O(1)
 # ГЛАВНАЯ ПРОГРАММА
 # -----------------------------
 def main():  # O(1)
-    sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000]  # O(1)
+    # matplotlib нужен только для графиков: импорт модуля ради binary_search
+    # (mmap_index, eytzinger) не должен его загружать
+    import matplotlib.pyplot as plt  # O(1)
+
+    sizes = SIZES  # O(1)
     linear_times = []  # O(1)
     binary_times = []  # O(1)
 
@@ -67,6 +386,50 @@ def main():  # O(1)
 
         print(f"Размер: {size}, Linear avg: {linear_times[-1]:.6f}, Binary avg: {binary_times[-1]:.6f}")  # O(1)
 
+    # Пакетный поиск: k запросов по одному массиву за один вызов
+    batch_arr = list(range(sizes[-1]))  # O(n)
+    batch_targets = [random.randrange(-10, sizes[-1] + 10) for _ in range(10 ** 5)]  # O(k)
+    start = time.perf_counter()  # O(1)
+    single = [binary_search(batch_arr, t) for t in batch_targets]  # O(k log n)
+    single_time = time.perf_counter() - start  # O(1)
+    start = time.perf_counter()  # O(1)
+    many = binary_search_many(batch_arr, batch_targets)  # O(k log k + k log n)
+    many_time = time.perf_counter() - start  # O(1)
+    assert many == single  # ключи уникальны, индексы совпадают
+    print(f"Пакет из {len(batch_targets)} ключей: binary_search x k {single_time:.4f} с, "
+          f"binary_search_many {many_time:.4f} с")  # O(1)
+
+    # Поиск многих ключей в неотсортированном массиве за один проход
+    unsorted = random.sample(range(10 ** 6), 10 ** 5)  # O(n)
+    keys = random.sample(unsorted, 50) + [-1]  # O(k)
+    start = time.perf_counter()  # O(1)
+    single = [linear_search(unsorted, t) for t in keys]  # O(k * n)
+    single_time = time.perf_counter() - start  # O(1)
+    start = time.perf_counter()  # O(1)
+    assert linear_search_many(unsorted, keys) == single  # O(n + k)
+    many_time = time.perf_counter() - start  # O(1)
+    print(f"{len(keys)} ключей в неотсортированном массиве: linear_search x k {single_time:.4f} с, "
+          f"linear_search_many {many_time:.4f} с")  # O(1)
+
+    # Вещественные ключи: интерполяция должна давать целый индекс
+    float_keys = [i * 0.5 for i in range(100)]  # O(n)
+    assert AdaptiveSearch(float_keys).search(10.0) == binary_search(float_keys, 10.0) == 20  # O(log log n)
+    assert interpolation_search(float_keys, 10.25) == -1  # O(log log n)
+    assert all(interpolation_search(float_keys, x) == i for i, x in enumerate(float_keys))  # O(n log log n)
+
+    # Адаптивный поиск: число проб и время на запрос
+    print(f"{'Данные':>12} {'Запросы':>10} {'Алгоритм':>14} {'Пробы':>8} {'мкс/запрос':>11}")  # O(1)
+    rows = compare_adaptive(sizes[-1])  # O(n + q log n)
+    best = {}  # (данные, запросы) -> наименьшее число проб среди фиксированных стратегий
+    for data_name, pattern, name, probes, micros in rows:  # O(1)
+        print(f"{data_name:>12} {pattern:>10} {name:>14} {probes:>8.2f} {micros:>11.3f}")  # O(1)
+        if name != "adaptive":  # O(1)
+            key = (data_name, pattern)  # O(1)
+            best[key] = min(best.get(key, probes), probes)  # O(1)
+    # адаптивный поиск не должен заметно проигрывать лучшей фиксированной стратегии
+    assert all(probes <= best[data_name, pattern] * 1.05 + 0.1
+               for data_name, pattern, name, probes, _ in rows if name == "adaptive")  # O(1)
+
     # График 1: линейный масштаб
     plt.figure(figsize=(10, 6))  # O(1)
     plt.plot(sizes, linear_times, label="Линейный поиск O(n)", marker="o")  # O(k)
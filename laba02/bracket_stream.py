@@ -0,0 +1,209 @@
+"""
+bracket_stream.py
+Потоковая и параллельная проверка сбалансированности скобок для больших входов.
+
+is_brackets_balanced требует весь документ в памяти и идёт по нему посимвольно
+на одном ядре. Здесь:
+- BracketChecker — возобновляемая проверка: feed(chunk) принимает очередной
+  блок (str или bytes) и хранит стек между вызовами; участки без скобок
+  пропускаются регулярным выражением в C, а не циклом Python;
+- состояние проверки — это сводка блока: неспаренные закрывающие скобки
+  (слева), затем незакрытые открывающие (справа) и первая локальная ошибка.
+  Сводки соседних блоков объединяются ассоциативно (merge), поэтому блоки
+  файла можно обработать в пуле процессов и склеить результаты по порядку;
+- результат содержит смещение первой ошибки (в символах для str, в байтах
+  для bytes/файлов).
+
+Скобки — ASCII, поэтому файлы в UTF-8 можно проверять побайтно.
+"""
+
+import mmap
+import os
+import re
+from array import array
+from multiprocessing import Pool
+from typing import Optional, Tuple
+
+CHUNK_SIZE = 1 << 20  # байт / символов в одном блоке
+
+# коды скобок: 0..2 — открывающие, 3..5 — соответствующие закрывающие
+_CODES = {}
+for _code, _ch in enumerate("([{)]}"):
+    _CODES[_ch] = _code
+    _CODES[ord(_ch)] = _code  # элемент bytes — int
+_STR_PATTERN = re.compile(r"[()\[\]{}]")
+_BYTES_PATTERN = re.compile(rb"[()\[\]{}]")
+
+
+class BracketChecker:
+    """Сводка обработанного префикса; feed продолжает проверку с места остановки."""
+    __slots__ = ("offset", "error", "closers", "closer_offsets", "openers", "opener_offsets")
+
+    def __init__(self, offset: int = 0):
+        self.offset = offset          # смещение начала следующего блока
+        self.error: Optional[int] = None  # первая несовпавшая пара внутри сводки
+        self.closers = bytearray()    # неспаренные закрывающие (стек был пуст)
+        self.closer_offsets = array("q")
+        self.openers = bytearray()    # стек незакрытых открывающих
+        self.opener_offsets = array("q")
+
+    def feed(self, chunk) -> "BracketChecker":
+        """Обработать очередной блок. O(len(chunk)), скобки — цикл Python,
+        остальные символы пропускаются в C.
+        """
+        base = self.offset
+        self.offset += len(chunk)
+        if self.error is not None:
+            return self
+        pattern = _BYTES_PATTERN if isinstance(chunk, (bytes, bytearray, mmap.mmap)) else _STR_PATTERN
+        codes = _CODES
+        openers, opener_offsets = self.openers, self.opener_offsets
+        for match in pattern.finditer(chunk):
+            pos = match.start()
+            code = codes[chunk[pos]]
+            if code < 3:
+                openers.append(code)
+                opener_offsets.append(base + pos)
+            elif openers:
+                if openers.pop() != code - 3:
+                    self.error = base + pos
+                    return self
+                opener_offsets.pop()
+            else:
+                self.closers.append(code)
+                self.closer_offsets.append(base + pos)
+        return self
+
+    def merge(self, right: "BracketChecker") -> "BracketChecker":
+        """Присоединить сводку следующего блока (на месте). Операция ассоциативна.
+        Закрывающие скобки right спариваются с открывающими self справа налево.
+        """
+        self.offset = right.offset
+        if self.error is not None:
+            return self
+        openers, opener_offsets = self.openers, self.opener_offsets
+        for code, pos in zip(right.closers, right.closer_offsets):
+            if openers:
+                if openers.pop() != code - 3:
+                    self.error = pos
+                    return self
+                opener_offsets.pop()
+            else:
+                self.closers.append(code)
+                self.closer_offsets.append(pos)
+        if right.error is not None:
+            self.error = right.error
+            return self
+        openers.extend(right.openers)
+        opener_offsets.extend(right.opener_offsets)
+        return self
+
+    def first_error(self) -> Optional[int]:
+        """Смещение первой ошибки или None. Незакрытая открывающая скобка
+        считается ошибкой только в конце ввода — берётся самая ранняя из них.
+        """
+        if self.closers:
+            return self.closer_offsets[0]
+        if self.error is not None:
+            return self.error
+        if self.openers:
+            return self.opener_offsets[0]
+        return None
+
+    def result(self) -> Tuple[bool, Optional[int]]:
+        """(сбалансировано ли, смещение первой ошибки)."""
+        error = self.first_error()
+        return error is None, error
+
+    def __reduce__(self):
+        # сводки передаются из рабочих процессов пула
+        return _restore, (self.offset, self.error, self.closers, self.closer_offsets,
+                          self.openers, self.opener_offsets)
+
+
+def _restore(offset, error, closers, closer_offsets, openers, opener_offsets):
+    checker = BracketChecker(offset)
+    checker.error = error
+    checker.closers, checker.closer_offsets = closers, closer_offsets
+    checker.openers, checker.opener_offsets = openers, opener_offsets
+    return checker
+
+
+def check(text) -> Tuple[bool, Optional[int]]:
+    """Проверка строки или bytes целиком."""
+    return BracketChecker().feed(text).result()
+
+
+def check_stream(stream, chunk_size: int = CHUNK_SIZE) -> Tuple[bool, Optional[int]]:
+    """Проверка файлового объекта (текстового или двоичного) блоками. Память: O(chunk_size + глубина)."""
+    checker = BracketChecker()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return checker.result()
+        checker.feed(chunk)
+
+
+def _summarize_range(task) -> BracketChecker:
+    """Рабочая функция: сводка байтов [start, stop) файла через mmap."""
+    path, start, stop = task
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return BracketChecker(start).feed(mm[start:stop])
+
+
+def check_file_parallel(path, workers: Optional[int] = None,
+                        chunk_size: int = CHUNK_SIZE) -> Tuple[bool, Optional[int]]:
+    """Параллельная проверка файла: сводки блоков считаются в пуле процессов
+    и объединяются по порядку. Смещение ошибки — в байтах.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return True, None
+    tasks = [(os.fspath(path), start, min(start + chunk_size, size))
+             for start in range(0, size, chunk_size)]
+    with Pool(workers) as pool:
+        summaries = pool.imap(_summarize_range, tasks)
+        total = next(summaries)
+        for summary in summaries:
+            total.merge(summary)
+    return total.result()
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    from task_solutions import is_brackets_balanced
+
+    # Сверка с is_brackets_balanced и ассоциативность merge
+    for _ in range(2000):
+        text = "".join(random.choice("()[]{}ab") for _ in range(random.randint(0, 30)))
+        ok, error = check(text)
+        assert ok == is_brackets_balanced(text), text
+        cut = random.randint(0, len(text))
+        left = BracketChecker().feed(text[:cut])
+        right = BracketChecker(cut).feed(text[cut:])
+        assert left.merge(right).result() == (ok, error), text
+    assert check("ab(]") == (False, 3)
+    assert check("x)(") == (False, 1)
+    assert check("(()") == (False, 0)
+    print("Все тесты успешно пройдены.")
+
+    # документ, похожий на исходный код: скобки редки относительно текста
+    line = "    result = compute(values[index], {'key': option}) + offset  # comment text\n"
+    body = ("def block():\n" + line * 1000 + "\n").encode()
+    path = os.path.join(tempfile.gettempdir(), "brackets.txt")
+    with open(path, "wb") as f:
+        for _ in range(1000):
+            f.write(body)
+    size_mb = os.path.getsize(path) / 2 ** 20
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        sequential = check_stream(f)
+    t_seq = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = check_file_parallel(path)
+    t_par = time.perf_counter() - start
+    assert sequential == parallel
+    print(f"{size_mb:.1f} МБ: потоково {t_seq:.2f} с, параллельно {t_par:.2f} с, результат {parallel}")
+    os.remove(path)
@@ -0,0 +1,164 @@
+"""
+event_simulation.py
+Дискретно-событийная модель очереди печати с несколькими принтерами,
+приоритетами, временем обслуживания и процессом поступления заданий.
+
+simulate_print_queue моделирует один FIFO-принтер с нулевым временем печати;
+здесь — c одинаковых принтеров (многоканальная система массового обслуживания).
+
+Компактное представление событий:
+- задания — это индексы 0..n-1, их атрибуты лежат в параллельных array
+  (время поступления, время обслуживания, приоритет), объектов-заданий нет;
+- поступления уже отсортированы по времени и читаются указателем, в кучу
+  они не попадают;
+- куча окончаний печати хранит только float-время (не больше c элементов:
+  принтеры одинаковы, важен лишь момент освобождения);
+- очередь ожидания — куча целых ключей (приоритет << 32) | индекс: меньший
+  приоритет обслуживается раньше, внутри приоритета — FIFO по индексу.
+
+Результат: пропускная способность, загрузка принтеров и перцентили ожидания.
+"""
+
+import heapq
+import random
+import time
+from array import array
+from itertools import accumulate, compress, repeat
+from operator import eq
+from typing import Dict, Sequence
+
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+
+
+def generate_workload(n: int, arrival_rate: float, service_mean: float,
+                      priority_weights: Sequence[float] = (1.0,),
+                      arrival: str = "poisson", service: str = "exponential",
+                      seed=None):
+    """Генерирует n заданий. Возвращает (arrivals, services, priorities) — три array.
+    arrival: "poisson" (экспоненциальные интервалы) или "deterministic";
+    service: "exponential" или "deterministic";
+    priority_weights[p] — доля заданий с приоритетом p (0 — наивысший).
+    """
+    rng = random.Random(seed)
+    if arrival == "poisson":
+        gaps = (rng.expovariate(arrival_rate) for _ in range(n))
+    elif arrival == "deterministic":
+        gaps = (1.0 / arrival_rate for _ in range(n))
+    else:
+        raise ValueError(f"неизвестный процесс поступления: {arrival}")
+    if service == "exponential":
+        services = array("d", (rng.expovariate(1.0 / service_mean) for _ in range(n)))
+    elif service == "deterministic":
+        services = array("d", [service_mean]) * n
+    else:
+        raise ValueError(f"неизвестное распределение обслуживания: {service}")
+    arrivals = array("d", accumulate(gaps))
+    priorities = array("B", rng.choices(range(len(priority_weights)), priority_weights, k=n))
+    return arrivals, services, priorities
+
+
+def _percentiles(values, points=(50, 90, 99)) -> Dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {f"p{p}": 0.0 for p in points}
+    last = len(ordered) - 1
+    return {f"p{p}": ordered[min(last, len(ordered) * p // 100)] for p in points}
+
+
+def simulate(arrivals: Sequence[float], services: Sequence[float],
+             priorities: Sequence[int], servers: int = 1) -> dict:
+    """Моделирует очередь с servers принтерами.
+    arrivals должны быть отсортированы по возрастанию.
+    Каждое задание порождает два события (поступление и окончание печати).
+    Сложность: O(n log n) по времени, O(n) по памяти (массивы ожиданий).
+    """
+    n = len(arrivals)
+    if not len(services) == len(priorities) == n:
+        raise ValueError("arrivals, services и priorities должны быть одной длины")
+    if servers < 1:
+        raise ValueError("servers должно быть положительным")
+    if n > ID_MASK:
+        raise ValueError("слишком много заданий для упаковки ключа очереди")
+
+    waits = array("d", bytes(8 * n))
+    busy = []      # куча моментов окончания печати, len(busy) <= servers
+    waiting = []   # куча ключей (приоритет << ID_BITS) | индекс
+    push, pop, replace = heapq.heappush, heapq.heappop, heapq.heapreplace
+    inf = float("inf")
+    idle = servers
+    next_done = inf  # busy[0] или inf, если все принтеры свободны
+    queued = 0
+    max_queue = 0
+    i = 0
+    now = 0.0
+
+    while i < n or next_done < inf:
+        if i < n and arrivals[i] < next_done:
+            # событие поступления задания i
+            now = arrivals[i]
+            if idle:
+                idle -= 1
+                push(busy, now + services[i])
+                next_done = busy[0]
+            else:
+                push(waiting, (priorities[i] << ID_BITS) | i)
+                queued += 1
+                if queued > max_queue:
+                    max_queue = queued
+            i += 1
+        else:
+            # событие окончания печати: принтер берёт следующее задание
+            now = next_done
+            if queued:
+                queued -= 1
+                j = pop(waiting) & ID_MASK
+                waits[j] = now - arrivals[j]
+                replace(busy, now + services[j])
+                next_done = busy[0]
+            else:
+                pop(busy)
+                idle += 1
+                next_done = busy[0] if busy else inf
+
+    makespan = now - (arrivals[0] if n else 0.0)
+    total_service = sum(services)
+    by_priority = {}
+    for p in sorted(set(priorities)):
+        selected = array("d", compress(waits, map(eq, priorities, repeat(p))))
+        by_priority[p] = {"jobs": len(selected), "mean_wait": sum(selected) / len(selected),
+                          **_percentiles(selected)}
+    return {
+        "jobs": n,
+        "events": 2 * n,
+        "makespan": makespan,
+        "throughput": n / makespan if makespan > 0 else float("inf"),
+        "utilisation": total_service / (servers * makespan) if makespan > 0 else 0.0,
+        "mean_wait": sum(waits) / n if n else 0.0,
+        "max_queue": max_queue,
+        "wait": _percentiles(waits),
+        "by_priority": by_priority,
+    }
+
+
+if __name__ == "__main__":
+    # Проверка на M/M/1: среднее ожидание Wq = rho / (mu - lambda)
+    lam, mu = 0.8, 1.0
+    arrivals, services, priorities = generate_workload(200000, lam, 1 / mu, seed=1)
+    result = simulate(arrivals, services, priorities, servers=1)
+    expected = (lam / mu) / (mu - lam)
+    assert abs(result["mean_wait"] - expected) / expected < 0.15, result["mean_wait"]
+    print(f"M/M/1: Wq = {result['mean_wait']:.3f} (теория {expected:.3f})")
+
+    n = 5 * 10 ** 6  # 10^7 событий
+    arrivals, services, priorities = generate_workload(
+        n, arrival_rate=3.6, service_mean=1.0, priority_weights=(0.2, 0.5, 0.3), seed=2)
+    start = time.perf_counter()
+    result = simulate(arrivals, services, priorities, servers=4)
+    elapsed = time.perf_counter() - start
+    print(f"{result['events']} событий за {elapsed:.2f} с ({result['events'] / elapsed:,.0f} событий/с)")
+    print(f"Пропускная способность: {result['throughput']:.3f} заданий/ед. времени, "
+          f"загрузка {result['utilisation']:.1%}, макс. очередь {result['max_queue']}")
+    print(f"Ожидание: среднее {result['mean_wait']:.3f}, {result['wait']}")
+    for p, stats in result["by_priority"].items():
+        print(f"  приоритет {p}: {stats}")
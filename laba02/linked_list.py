@@ -4,12 +4,15 @@ linked_list.py
 
 Классы:
 - Node — элемент списка.
+- NodePool — пул освобождённых узлов для повторного использования.
 - LinkedList — сам список.
+- Block — узел развёрнутого списка (блок фиксированной ёмкости, __slots__).
+- UnrolledLinkedList — развёрнутый список с тем же интерфейсом, что и LinkedList.
 
 После каждого метода указана асимптотическая сложность.
 """
 
-from typing import Any, Optional, Iterator
+from typing import Any, Iterable, Iterator, List, Optional
 
 
 class Node:
@@ -21,18 +24,81 @@ class Node:
         return f"Node({self.value!r})"
 
 
+class NodePool:
+    """Список свободных узлов (free-list) для очередей на LinkedList.
+    Узлы, освобождённые delete_from_start/pop_many/clear, хранятся цепочкой
+    через поле next и выдаются повторно вместо создания новых Node, что
+    снижает нагрузку на аллокатор и сборщик мусора. Хранится не более
+    capacity узлов, лишние отдаются сборщику мусора.
+    Один пул может обслуживать несколько списков.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 0:
+            raise ValueError("capacity должна быть неотрицательной")
+        self.capacity = capacity
+        self._free: Optional[Node] = None
+        self._free_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._free_count
+
+    def acquire(self, value: Any, next: Optional[Node] = None) -> Node:
+        """Узел из пула (попадание) или новый Node (промах). O(1)"""
+        node = self._free
+        if node is None:
+            self.misses += 1
+            return Node(value, next)
+        self._free = node.next
+        self._free_count -= 1
+        self.hits += 1
+        node.value = value
+        node.next = next
+        return node
+
+    def release(self, node: Node) -> bool:
+        """Вернуть узел в пул. False, если пул полон. O(1)"""
+        if self._free_count >= self.capacity:
+            self.dropped += 1
+            return False
+        node.value = None  # не удерживаем ссылку на значение
+        node.next = self._free
+        self._free = node
+        self._free_count += 1
+        return True
+
+    def stats(self) -> dict:
+        """Счётчики попаданий, промахов, отброшенных и свободных узлов."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "dropped": self.dropped,
+            "free": self._free_count,
+        }
+
+
 class LinkedList:
-    def __init__(self):
+    def __init__(self, pool: Optional[NodePool] = None):
+        """:param pool: необязательный NodePool для повторного использования узлов"""
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
         self._size = 0
+        self.pool = pool
 
     def __len__(self) -> int:
         return self._size
 
     def insert_at_start(self, value: Any) -> None:
         """Вставка в начало списка. O(1)"""
-        new_node = Node(value, self.head)
+        if self.pool is None:
+            new_node = Node(value, self.head)
+        else:
+            new_node = self.pool.acquire(value, self.head)
         self.head = new_node
         if self.tail is None:
             self.tail = new_node
@@ -40,7 +106,7 @@ class LinkedList:
 
     def insert_at_end(self, value: Any) -> None:
         """Вставка в конец списка. O(1) при наличии хвоста"""
-        new_node = Node(value)
+        new_node = Node(value) if self.pool is None else self.pool.acquire(value)
         if self.tail is None:
             self.head = self.tail = new_node
         else:
@@ -52,13 +118,123 @@ class LinkedList:
         """Удаление из начала списка. O(1)"""
         if self.head is None:
             raise IndexError("delete_from_start from empty LinkedList")
-        value = self.head.value
-        self.head = self.head.next
+        node = self.head
+        value = node.value
+        self.head = node.next
         if self.head is None:
             self.tail = None
         self._size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return value
 
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> "LinkedList":
+        """Построение списка из итерируемого объекта. O(n)"""
+        ll = cls()
+        ll.extend(iterable)
+        return ll
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Добавление всех элементов в конец. O(k)
+        Узлы связываются в одном цикле на локальных переменных,
+        без вызова insert_at_end на каждый элемент.
+        """
+        head = tail = None
+        count = 0
+        make = Node if self.pool is None else self.pool.acquire
+        for value in iterable:
+            node = make(value)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        if head is None:
+            return
+        if self.tail is None:
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self._size += count
+
+    def extendleft(self, iterable: Iterable[Any]) -> None:
+        """Добавление элементов в начало по одному, как deque.extendleft:
+        итоговый порядок добавленных элементов обратный. O(k)
+        """
+        head = self.head
+        tail = self.tail
+        count = 0
+        make = Node if self.pool is None else self.pool.acquire
+        for value in iterable:
+            head = make(value, head)
+            if tail is None:
+                tail = head
+            count += 1
+        self.head = head
+        self.tail = tail
+        self._size += count
+
+    def concat(self, other: "LinkedList") -> None:
+        """Перенос всех узлов other в конец списка. O(1) благодаря хвосту.
+        После операции other пуст (узлы не копируются).
+        """
+        self.splice(self.tail, other)
+
+    def splice(self, node: Optional[Node], other: "LinkedList") -> None:
+        """Вставка всех узлов other сразу после узла node
+        (node=None — в начало списка). O(1). После операции other пуст.
+        """
+        if other is self:
+            raise ValueError("нельзя вставить список сам в себя")
+        if other.head is None:
+            return
+        if node is None:
+            other.tail.next = self.head
+            self.head = other.head
+            if self.tail is None:
+                self.tail = other.tail
+        else:
+            other.tail.next = node.next
+            node.next = other.head
+            if node is self.tail:
+                self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+
+    def reverse(self) -> None:
+        """Разворот списка на месте перестановкой ссылок. O(n)"""
+        prev = None
+        current = self.head
+        self.tail = current
+        while current is not None:
+            current.next, prev, current = prev, current, current.next
+        self.head = prev
+
+    def pop_many(self, k: int) -> List[Any]:
+        """Удаление первых k элементов; возвращает их значения по порядку. O(k)"""
+        if k < 0:
+            raise ValueError("k должно быть неотрицательным")
+        if k > self._size:
+            raise IndexError("pop_many: в списке меньше k элементов")
+        values = []
+        append = values.append
+        release = None if self.pool is None else self.pool.release
+        current = self.head
+        for _ in range(k):
+            append(current.value)
+            node, current = current, current.next
+            if release is not None:
+                release(node)
+        self.head = current
+        if current is None:
+            self.tail = None
+        self._size -= k
+        return values
+
     def traversal(self) -> Iterator[Any]:
         """Обход всех элементов списка. O(n)"""
         current = self.head
@@ -71,7 +247,16 @@ class LinkedList:
         return list(self.traversal())
 
     def clear(self) -> None:
-        """Очистить список. O(n)"""
+        """Очистить список. O(1) без пула, O(min(n, свободное место в пуле)) с пулом"""
+        pool = self.pool
+        current = self.head
+        released = 0
+        while pool is not None and current is not None and len(pool) < pool.capacity:
+            node, current = current, current.next
+            pool.release(node)
+            released += 1
+        if pool is not None:
+            pool.dropped += self._size - released  # не поместившиеся в пул — O(1) по размеру
         self.head = None
         self.tail = None
         self._size = 0
@@ -81,3 +266,110 @@ class LinkedList:
 
     def __repr__(self):
         return "LinkedList(" + "->".join(repr(x) for x in self.traversal()) + ")"
+
+
+class Block:
+    """Узел развёрнутого списка: до capacity элементов в items[start:end].
+    __slots__ убирает __dict__ у узла, а элементы лежат в одном list подряд,
+    поэтому на элемент приходится ~8 байт ссылки вместо целого объекта Node.
+    """
+    __slots__ = ("items", "start", "end", "next")
+
+    def __init__(self, capacity: int, start: int):
+        self.items: list = [None] * capacity
+        self.start = start
+        self.end = start
+        self.next: Optional["Block"] = None
+
+    def __repr__(self):
+        return f"Block({self.items[self.start:self.end]!r})"
+
+
+class UnrolledLinkedList:
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("capacity должна быть положительной")
+        self.capacity = capacity
+        self.head: Optional[Block] = None
+        self.tail: Optional[Block] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert_at_start(self, value: Any) -> None:
+        """Вставка в начало списка. O(1)
+        Головной блок заполняется справа налево; если слева места нет,
+        впереди создаётся новый блок, заполняемый с конца.
+        """
+        head = self.head
+        if head is None or head.start == 0:
+            block = Block(self.capacity, self.capacity)
+            block.next = head
+            self.head = block
+            if self.tail is None:
+                self.tail = block
+            head = block
+        head.start -= 1
+        head.items[head.start] = value
+        self._size += 1
+
+    def insert_at_end(self, value: Any) -> None:
+        """Вставка в конец списка. O(1)"""
+        tail = self.tail
+        if tail is None or tail.end == self.capacity:
+            block = Block(self.capacity, 0)
+            if tail is None:
+                self.head = block
+            else:
+                tail.next = block
+            self.tail = block
+            tail = block
+        tail.items[tail.end] = value
+        tail.end += 1
+        self._size += 1
+
+    def delete_from_start(self) -> Any:
+        """Удаление из начала списка. O(1)"""
+        head = self.head
+        if head is None:
+            raise IndexError("delete_from_start from empty UnrolledLinkedList")
+        value = head.items[head.start]
+        head.items[head.start] = None  # не удерживаем ссылку на удалённый элемент
+        head.start += 1
+        if head.start == head.end:
+            self.head = head.next
+            if self.head is None:
+                self.tail = None
+        self._size -= 1
+        return value
+
+    def traversal(self) -> Iterator[Any]:
+        """Обход всех элементов списка. O(n)
+        Внутри блока элементы отдаются срезом — без перехода по ссылке на каждый.
+        """
+        block = self.head
+        while block is not None:
+            yield from block.items[block.start:block.end]
+            block = block.next
+
+    def to_list(self) -> list:
+        """Преобразовать в обычный список Python. O(n)"""
+        result = []
+        block = self.head
+        while block is not None:
+            result.extend(block.items[block.start:block.end])
+            block = block.next
+        return result
+
+    def clear(self) -> None:
+        """Очистить список. O(1)"""
+        self.head = None
+        self.tail = None
+        self._size = 0
+
+    def __iter__(self):
+        return self.traversal()
+
+    def __repr__(self):
+        return "UnrolledLinkedList(" + "->".join(repr(x) for x in self.traversal()) + ")"
@@ -2,12 +2,27 @@
 performance_analysis.py
 Сравнение производительности встроенных структур данных (list, deque)
 и пользовательского LinkedList.
+
+Полный набор замеров (python performance_analysis.py --suite) покрывает
+вставку/удаление с обоих концов, произвольный доступ, обход и вставку в
+середину для list, deque, LinkedList и array до n = 10^7 с бюджетом времени,
+прогревом, медианой/IQR и байтами на элемент (tracemalloc); результаты
+сохраняются в JSON/CSV для сравнения прогонов.
 """
 
+import argparse
+import csv
+import gc
+import json
+import random
+import statistics
 import timeit
+import tracemalloc
+from array import array
 from collections import deque
+from itertools import repeat
 import matplotlib.pyplot as plt
-from linked_list import LinkedList
+from linked_list import LinkedList, NodePool, UnrolledLinkedList
 from pathlib import Path
 
 OUT_DIR = Path(".")
@@ -68,6 +83,268 @@ def run_benchmarks(sizes):
     return results
 
 
+def build_memory(factory, n):
+    """Строит контейнер из n элементов и возвращает (контейнер, байт на элемент).
+    Учитывается только память самой структуры: элементы — малые int из кэша.
+    """
+    tracemalloc.start()
+    container = factory(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return container, current / n
+
+
+def compare_unrolled(n=10 ** 6, repetitions=3):
+    """Память на элемент и время полного обхода:
+    LinkedList (цепочка Node), UnrolledLinkedList и collections.deque.
+    """
+    def fill(cls):
+        def factory(size):
+            container = cls()
+            for i in range(size):
+                container.insert_at_end(i % 256)
+            return container
+        return factory
+
+    factories = {
+        "LinkedList": fill(LinkedList),
+        "UnrolledLinkedList": fill(UnrolledLinkedList),
+        "deque": lambda size: deque(i % 256 for i in range(size)),
+    }
+    results = {}
+    for name, factory in factories.items():
+        container, per_element = build_memory(factory, n)
+        traverse = timeit.timeit(lambda: sum(1 for _ in container), number=repetitions) / repetitions
+        results[name] = {"bytes_per_element": per_element, "traversal_s": traverse}
+        del container
+    return results
+
+
+def compare_bulk(n=10 ** 6, repetitions=3):
+    """Поэлементные операции LinkedList против пакетных (секунды на операцию над n)."""
+    def timed(func):
+        return timeit.timeit(func, number=repetitions) / repetitions
+
+    def elementwise_build():
+        ll = LinkedList()
+        for i in range(n):
+            ll.insert_at_end(i)
+
+    def elementwise_pop():
+        ll = LinkedList.from_iterable(range(n))
+        start = timeit.default_timer()
+        for _ in range(n):
+            ll.delete_from_start()
+        return timeit.default_timer() - start
+
+    def bulk_pop():
+        ll = LinkedList.from_iterable(range(n))
+        start = timeit.default_timer()
+        ll.pop_many(n)
+        return timeit.default_timer() - start
+
+    def elementwise_concat():
+        a, b = LinkedList(), LinkedList.from_iterable(range(n))
+        start = timeit.default_timer()
+        while len(b):
+            a.insert_at_end(b.delete_from_start())
+        return timeit.default_timer() - start
+
+    def bulk_concat():
+        a, b = LinkedList(), LinkedList.from_iterable(range(n))
+        start = timeit.default_timer()
+        a.concat(b)
+        return timeit.default_timer() - start
+
+    return {
+        "build": (timed(elementwise_build), timed(lambda: LinkedList.from_iterable(range(n)))),
+        "pop": (min(elementwise_pop() for _ in range(repetitions)),
+                min(bulk_pop() for _ in range(repetitions))),
+        "concat": (min(elementwise_concat() for _ in range(repetitions)),
+                   min(bulk_concat() for _ in range(repetitions))),
+    }
+
+
+def fifo_throughput(ll, messages, depth):
+    """Очередь постоянной глубины depth: insert_at_end + delete_from_start на сообщение.
+    Возвращает (сообщений/с, суммарная пауза сборщика мусора в секундах, число сборок).
+    """
+    pauses = []
+    started = []
+
+    def on_gc(phase, info):
+        if phase == "start":
+            started.append(timeit.default_timer())
+        elif started:
+            pauses.append(timeit.default_timer() - started.pop())
+
+    for i in range(depth):
+        ll.insert_at_end(i)
+    gc.callbacks.append(on_gc)
+    try:
+        start = timeit.default_timer()
+        for i in range(messages):
+            ll.insert_at_end(i)
+            ll.delete_from_start()
+        elapsed = timeit.default_timer() - start
+    finally:
+        gc.callbacks.remove(on_gc)
+    return messages / elapsed, sum(pauses), len(pauses)
+
+
+def compare_pool(messages=10 ** 6, depth=1000, pool_capacity=1024):
+    """FIFO-нагрузка на LinkedList без пула и с NodePool."""
+    plain = fifo_throughput(LinkedList(), messages, depth)
+    pool = NodePool(pool_capacity)
+    pooled = fifo_throughput(LinkedList(pool), messages, depth)
+    return {"без пула": plain, "NodePool": pooled, "stats": pool.stats()}
+
+
+# ---------------------------------------------------------------
+# ПОЛНЫЙ НАБОР ЗАМЕРОВ
+# ---------------------------------------------------------------
+SUITE_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+SUITE_OPS = 1000          # операций в одном замере (для обхода — весь контейнер)
+MEMORY_MAX_SIZE = 10 ** 6  # tracemalloc сильно замедляет построение больших контейнеров
+
+# элементы — кэшированный int 0, поэтому tracemalloc видит только память самой структуры
+CONTAINERS = {
+    "list": lambda n: list(repeat(0, n)),
+    "deque": lambda n: deque(repeat(0, n)),
+    "LinkedList": lambda n: LinkedList.from_iterable(repeat(0, n)),
+    "array": lambda n: array("q", repeat(0, n)),
+}
+
+
+def _run_ops(method, count, *args):
+    for _ in range(count):
+        method(*args)
+
+
+def _random_access(c, indices):
+    for i in indices:
+        c[i]
+
+
+def _insert_middle(c, count):
+    for _ in range(count):
+        c.insert(len(c) // 2, 0)
+
+
+# операция -> {контейнер: функция(контейнер, число операций)}; отсутствие — операция
+# не поддерживается (у односвязного LinkedList нет удаления с конца и индексации).
+# random_access получает вместо числа операций заранее выбранные индексы.
+OPERATIONS = {
+    "append_right": {
+        "list": lambda c, k: _run_ops(c.append, k, 0),
+        "deque": lambda c, k: _run_ops(c.append, k, 0),
+        "LinkedList": lambda c, k: _run_ops(c.insert_at_end, k, 0),
+        "array": lambda c, k: _run_ops(c.append, k, 0),
+    },
+    "append_left": {
+        "list": lambda c, k: _run_ops(c.insert, k, 0, 0),
+        "deque": lambda c, k: _run_ops(c.appendleft, k, 0),
+        "LinkedList": lambda c, k: _run_ops(c.insert_at_start, k, 0),
+        "array": lambda c, k: _run_ops(c.insert, k, 0, 0),
+    },
+    "pop_right": {
+        "list": lambda c, k: _run_ops(c.pop, k),
+        "deque": lambda c, k: _run_ops(c.pop, k),
+        "array": lambda c, k: _run_ops(c.pop, k),
+    },
+    "pop_left": {
+        "list": lambda c, k: _run_ops(c.pop, k, 0),
+        "deque": lambda c, k: _run_ops(c.popleft, k),
+        "LinkedList": lambda c, k: _run_ops(c.delete_from_start, k),
+        "array": lambda c, k: _run_ops(c.pop, k, 0),
+    },
+    "random_access": {
+        "list": _random_access,
+        "deque": _random_access,
+        "array": _random_access,
+    },
+    "iterate": {name: (lambda c, k: sum(1 for _ in c)) for name in CONTAINERS},
+    "insert_middle": {
+        "list": _insert_middle,
+        "deque": _insert_middle,
+        "array": _insert_middle,
+    },
+}
+
+
+def measure_case(container, operation, n, repeats=5, warmup=1):
+    """Время одной операции (нс): медиана и межквартильный размах по repeats замерам.
+    Для каждого замера контейнер строится заново (вне замера), так что удаления
+    не истощают его. Первые warmup замеров отбрасываются.
+    """
+    build = CONTAINERS[container]
+    op = OPERATIONS[operation][container]
+    count = n if operation == "iterate" else min(SUITE_OPS, n)
+    arg = random.sample(range(n), count) if operation == "random_access" else count
+    samples = []
+    for run in range(warmup + repeats):
+        c = build(n)
+        gc.disable()
+        try:
+            start = timeit.default_timer()
+            op(c, arg)
+            elapsed = timeit.default_timer() - start
+        finally:
+            gc.enable()
+        del c
+        if run >= warmup:
+            samples.append(elapsed / count * 1e9)
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4)
+    else:
+        q1 = q3 = samples[0]
+    return {"median_ns": statistics.median(samples), "iqr_ns": q3 - q1,
+            "repeats": repeats, "ops_per_sample": count}
+
+
+def run_suite(sizes=SUITE_SIZES, budget=30.0, repeats=5, warmup=1):
+    """Все пары (контейнер, операция) по возрастанию размера.
+    Если оценка времени следующего размера (линейная экстраполяция по текущему)
+    превышает budget секунд, большие размеры для этой пары пропускаются.
+    Возвращает список строк-словарей.
+    """
+    memory = {}
+    rows = []
+    for operation, containers in OPERATIONS.items():
+        for container in CONTAINERS:
+            if container not in containers:
+                continue
+            for i, n in enumerate(sizes):
+                if (container, n) not in memory and n <= MEMORY_MAX_SIZE:
+                    c, per_element = build_memory(CONTAINERS[container], n)
+                    memory[container, n] = per_element
+                    del c
+                start = timeit.default_timer()
+                row = {"container": container, "operation": operation, "size": n,
+                       "bytes_per_element": memory.get((container, n))}
+                row.update(measure_case(container, operation, n, repeats, warmup))
+                rows.append(row)
+                print(f"{operation:>14} {container:>10} n={n:<9} "
+                      f"{row['median_ns']:10.1f} нс ± {row['iqr_ns']:.1f} (IQR)")
+                spent = timeit.default_timer() - start
+                if i + 1 < len(sizes) and spent * sizes[i + 1] / n > budget:
+                    print(f"{operation:>14} {container:>10} размеры > {n} пропущены (бюджет {budget} с)")
+                    break
+    return rows
+
+
+def save_suite(rows, json_path=None, csv_path=None):
+    """Сохраняет результаты run_suite в JSON и/или CSV."""
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    if csv_path and rows:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
 def plot_results(results):
     sizes = results["size"]
 
@@ -94,7 +371,27 @@ def plot_results(results):
     plt.savefig(OUT_DIR / "pop_from_start_comparison.png")
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры list, deque, LinkedList и array")
+    parser.add_argument("--suite", action="store_true", help="запустить полный набор замеров")
+    parser.add_argument("--max-size", type=int, default=10 ** 7)
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="бюджет секунд на один размер пары (контейнер, операция)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", default="suite_results.json")
+    parser.add_argument("--csv", default="suite_results.csv")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.suite:
+        sizes = [n for n in SUITE_SIZES if n <= args.max_size]
+        rows = run_suite(sizes, budget=args.budget, repeats=args.repeats)
+        save_suite(rows, OUT_DIR / args.json, OUT_DIR / args.csv)
+        print(f"Результаты сохранены в {args.json} и {args.csv}")
+        return
+
     sizes = [100, 500, 1000, 2000, 4000]
     results = run_benchmarks(sizes)
     plot_results(results)
@@ -103,6 +400,23 @@ def main():
               f"LinkedList.insert={results['linkedlist_insert_start'][i]:.6f}s | "
               f"list.pop0={results['list_pop0'][i]:.6f}s | deque.popleft={results['deque_popleft'][i]:.6f}s")
 
+    n = 10 ** 6
+    print(f"\nПамять и обход, n={n}:")
+    for name, row in compare_unrolled(n).items():
+        print(f"{name:>20}: {row['bytes_per_element']:7.1f} байт/элемент, обход {row['traversal_s']:.4f}s")
+
+    print(f"\nПоэлементный и пакетный API LinkedList, n={n}:")
+    for op, (elementwise, bulk) in compare_bulk(n).items():
+        print(f"{op:>8}: поэлементно {elementwise:.4f}s | пакетно {bulk:.6f}s | "
+              f"ускорение x{elementwise / bulk if bulk else float('inf'):.1f}")
+
+    print(f"\nFIFO на LinkedList, {n} сообщений:")
+    pool_results = compare_pool(n)
+    for name in ("без пула", "NodePool"):
+        rate, gc_pause, collections = pool_results[name]
+        print(f"{name:>10}: {rate:,.0f} сообщ./с, паузы GC {gc_pause * 1000:.2f} мс ({collections} сборок)")
+    print(f"Статистика пула: {pool_results['stats']}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,156 @@
+"""
+print_service.py
+Асинхронная очередь печати (производитель / потребители) на asyncio.
+
+В отличие от simulate_print_queue, которая синхронно опустошает deque и
+накапливает список всех результатов, здесь:
+- очередь ограничена (capacity): производитель ждёт, пока принтеры не
+  освободят место (обратное давление, backpressure);
+- N параллельных «принтеров» забирают задания пачками через get_many,
+  поэтому на пачку приходится одно пробуждение, а не одно на задание;
+- результаты отдаются потоком (async-генератор), а не списком.
+
+Запуск нагрузочного теста: python print_service.py [число заданий]
+"""
+
+import asyncio
+import inspect
+import sys
+import time
+from array import array
+from typing import Any, AsyncIterator, Callable, Iterable, List
+
+_STOP = object()  # маркер конца потока заданий
+
+
+def print_job(job: Any) -> str:
+    """Принтер по умолчанию — тот же формат, что и у simulate_print_queue."""
+    return f"printed:{job}"
+
+
+class BatchQueue(asyncio.Queue):
+    """Ограниченная asyncio-очередь с пакетным извлечением."""
+
+    async def get_many(self, max_items: int) -> List[Any]:
+        """Ждёт хотя бы один элемент и забирает до max_items без ожидания.
+        O(k) на пачку из k элементов, одно пробуждение на пачку.
+        """
+        items = [await self.get()]
+        while len(items) < max_items and not self.empty():
+            items.append(self.get_nowait())
+        return items
+
+
+class PrintService:
+    def __init__(self, printers: int = 4, capacity: int = 1024, batch_size: int = 64,
+                 printer: Callable[[Any], Any] = print_job):
+        """
+        :param printers: число параллельных потребителей
+        :param capacity: ёмкость очереди заданий (0 — без ограничения)
+        :param batch_size: максимум заданий, забираемых принтером за раз
+        :param printer: функция или корутина-функция обработки одного задания
+        """
+        if printers < 1 or batch_size < 1:
+            raise ValueError("printers и batch_size должны быть положительными")
+        self.printers = printers
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.printer = printer
+        self._is_async = inspect.iscoroutinefunction(printer)
+
+    async def _produce(self, jobs, queue: BatchQueue) -> None:
+        if hasattr(jobs, "__aiter__"):
+            async for job in jobs:
+                await queue.put(job)
+        else:
+            for job in jobs:
+                await queue.put(job)
+        await queue.put(_STOP)
+
+    async def _consume(self, queue: BatchQueue, out: asyncio.Queue) -> None:
+        printer = self.printer
+        while True:
+            batch = await queue.get_many(self.batch_size)
+            stop = batch[-1] is _STOP  # после маркера в очереди ничего нет
+            if stop:
+                batch.pop()
+            if self._is_async:
+                results = [await printer(job) for job in batch]
+            else:
+                results = [printer(job) for job in batch]
+            if results:
+                await out.put(results)
+            if stop:
+                await queue.put(_STOP)  # маркер передаётся следующему принтеру
+                return
+
+    async def stream(self, jobs: Iterable[Any]) -> AsyncIterator[Any]:
+        """Обрабатывает jobs (обычный или асинхронный итерируемый объект)
+        и отдаёт результаты по мере готовности. Порядок результатов между
+        разными принтерами не гарантируется. Память: O(capacity).
+        """
+        queue = BatchQueue(self.capacity)
+        out = asyncio.Queue(max(1, self.capacity // self.batch_size))
+        workers = [asyncio.create_task(self._produce(jobs, queue))]
+        workers += [asyncio.create_task(self._consume(queue, out)) for _ in range(self.printers)]
+
+        async def finish():
+            try:
+                await asyncio.gather(*workers)
+            except Exception as exc:  # ошибка принтера или источника заданий
+                await out.put(exc)
+            else:
+                await out.put(_STOP)
+
+        finisher = asyncio.create_task(finish())
+        try:
+            while True:
+                batch = await out.get()
+                if batch is _STOP:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                for result in batch:
+                    yield result
+        finally:
+            for task in workers + [finisher]:
+                task.cancel()
+            await asyncio.gather(*workers, finisher, return_exceptions=True)
+
+
+async def run_load(jobs: int = 10 ** 6, printers: int = 4, capacity: int = 1024,
+                   batch_size: int = 64) -> dict:
+    """Нагрузочный тест: jobs заданий, каждое помечено временем постановки.
+    Возвращает пропускную способность (заданий/с) и p50/p99 задержки в очереди (с).
+    """
+    clock = time.perf_counter
+    service = PrintService(printers, capacity, batch_size, printer=lambda stamp: clock() - stamp)
+    latencies = array("d")
+    start = clock()
+    # генератор вызывается непосредственно перед put, поэтому метка ≈ момент постановки
+    async for latency in service.stream(clock() for _ in range(jobs)):
+        latencies.append(latency)
+    elapsed = clock() - start
+    ordered = sorted(latencies)
+    return {
+        "jobs": len(ordered),
+        "jobs_per_second": len(ordered) / elapsed,
+        "p50_latency": ordered[len(ordered) // 2] if ordered else 0.0,
+        "p99_latency": ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)] if ordered else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    async def check():
+        service = PrintService(printers=3, capacity=4, batch_size=2)
+        results = [r async for r in service.stream(["a", "b", "c", "d", "e"])]
+        assert sorted(results) == ["printed:a", "printed:b", "printed:c", "printed:d", "printed:e"]
+
+    asyncio.run(check())
+    print("Все тесты успешно пройдены.")
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    for batch_size in (1, 64):
+        stats = asyncio.run(run_load(total, batch_size=batch_size))
+        print(f"batch_size={batch_size:>3}: {stats['jobs_per_second']:,.0f} заданий/с, "
+              f"p50 {stats['p50_latency'] * 1000:.2f} мс, p99 {stats['p99_latency'] * 1000:.2f} мс")
@@ -4,10 +4,13 @@ task_solutions.py
 1. Проверка сбалансированности скобок с использованием стека (list)
 2. Симуляция очереди печати (deque)
 3. Проверка палиндрома с использованием дека (deque)
+4. Проверка палиндрома без копирования (str, bytes, memoryview, array, mmap)
 """
 
+import mmap
+from array import array
 from collections import deque
-from typing import Iterable
+from typing import Iterable, List, Sequence
 
 
 def is_brackets_balanced(s: str) -> bool:
@@ -42,6 +45,58 @@ def is_palindrome(seq: Iterable) -> bool:
     return True
 
 
+PALINDROME_BLOCK = 1 << 16  # элементов в сравниваемом блоке
+
+
+def is_palindrome_inplace(seq: Sequence, block: int = PALINDROME_BLOCK) -> bool:
+    """Проверка палиндрома двумя указателями без копирования входа в deque.
+    Сравниваются блоки: seq[i:i+k] с перевёрнутым seq[j-k:j], так что цикл
+    идёт в C, а не по одному элементу в Python.
+    bytes, bytearray, array и mmap оборачиваются в memoryview — срезы и
+    разворот [::-1] не копируют данные. Для str и list копируется только
+    текущий блок. Время: O(n), дополнительная память: O(block) или O(1).
+    """
+    if block < 1:
+        raise ValueError("block должен быть положительным")
+    # memoryview не умеет сравнивать элементы формата 'u'/'w' — такие array режутся сами
+    if isinstance(seq, (bytes, bytearray, mmap.mmap)) or (
+            isinstance(seq, array) and seq.typecode not in ("u", "w")):
+        with memoryview(seq) as view:
+            return _blocks_mirror(view, block)
+    return _blocks_mirror(seq, block)
+
+
+def _blocks_mirror(seq: Sequence, block: int) -> bool:
+    i, j = 0, len(seq)
+    while j - i > 1:
+        k = min(block, (j - i) // 2)
+        if seq[i:i + k] != seq[j - k:j][::-1]:
+            return False
+        i += k
+        j -= k
+    return True
+
+
+def is_palindrome_file(path: str, block: int = PALINDROME_BLOCK) -> bool:
+    """Проверка палиндрома для содержимого файла через mmap (побайтно).
+    Файл не читается в память целиком — страницы подгружаются ОС по мере сравнения.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # пустой файл нельзя отобразить
+            return True
+        with mm:
+            return is_palindrome_inplace(mm, block)
+
+
+def is_palindrome_many(seqs: Iterable[Sequence]) -> List[bool]:
+    """Пакетная проверка множества коротких последовательностей.
+    Для коротких входов дешевле всего сравнение с разворотом целиком: s == s[::-1].
+    """
+    return [s == s[::-1] for s in seqs]
+
+
 if __name__ == "__main__":
     # Тесты
     assert is_brackets_balanced("{[()()]}") is True
@@ -50,4 +105,9 @@ if __name__ == "__main__":
     assert is_palindrome("radar") is True
     assert is_palindrome([1, 2, 3, 2, 1]) is True
     assert is_palindrome([1, 2, 3]) is False
+    assert is_palindrome_inplace("radar") is True
+    assert is_palindrome_inplace(b"abca") is False
+    assert is_palindrome_inplace(array("i", [1, 2, 3, 2, 1]), block=1) is True
+    assert is_palindrome_inplace(memoryview(b"abba")) is True
+    assert is_palindrome_many(["radar", "ab", b"", [1, 2, 1]]) == [True, False, True, True]
     print("Все тесты успешно пройдены.")
@@ -0,0 +1,213 @@
+"""
+fs_index.py
+Сохраняемый на диск индекс дерева каталогов с инкрементальным обновлением.
+
+Каждый отчёт через walk_fs_recursive заново читает всё дерево, хотя почти все
+каталоги не менялись. FsIndex хранит дерево в SQLite (как и memo_cache):
+- dirs  — каталог, родитель, mtime каталога, число файлов и байт в нём;
+- files — файлы каталога с размерами.
+
+update(root) заново читает только каталоги, чей mtime изменился: создание,
+удаление и переименование записей меняют mtime каталога-владельца. Для
+неизменённого каталога делается один stat, а его подкаталоги берутся
+из индекса. Запросы size/count/glob выполняются по индексу и не обращаются
+к файловой системе.
+
+Ограничение: перезапись содержимого файла на месте не меняет mtime каталога,
+поэтому размер такого файла обновится только при следующем изменении
+каталога (или при update(..., full=True)).
+"""
+
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER, files INTEGER, bytes INTEGER);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE TABLE IF NOT EXISTS files (
+    dir TEXT, name TEXT, size INTEGER, PRIMARY KEY (dir, name));
+"""
+
+
+def _subtree_bounds(path: str) -> Tuple[str, str]:
+    """Полуинтервал строк [path/, path0) — все пути внутри path.
+    Сравнение строк в SQLite побайтовое, поэтому это диапазон по первичному ключу.
+    """
+    prefix = path.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class FsIndex:
+    def __init__(self, path: str):
+        """Открывает (или создаёт) индекс в файле SQLite path."""
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    # ---------------- Обновление ----------------
+
+    def update(self, root: str, full: bool = False) -> Dict[str, int]:
+        """
+        Синхронизирует индекс с деревом root. full=True — перечитать все каталоги.
+        Возвращает счётчики: scanned (прочитано каталогов), unchanged (только stat),
+        removed (удалено каталогов из индекса).
+        Временная сложность: O(D) stat + O(размер изменённых каталогов).
+        """
+        root = os.path.abspath(root)
+        stats = {"scanned": 0, "unchanged": 0, "removed": 0}
+        conn = self.conn
+        stack = [(root, os.path.dirname(root))]
+        with conn:  # одна транзакция на обновление
+            while stack:
+                path, parent = stack.pop()
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    stats["removed"] += self._remove_tree(path)
+                    continue
+                row = conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (path,)).fetchone()
+                if not full and row is not None and row[0] == mtime:
+                    stats["unchanged"] += 1
+                    stack.extend(conn.execute("SELECT path, parent FROM dirs WHERE parent = ?", (path,)))
+                    continue
+                try:
+                    files, subdirs = self._read_dir(path)
+                except OSError:
+                    stats["removed"] += self._remove_tree(path)
+                    continue
+                stats["scanned"] += 1
+                present = set(subdirs)
+                for (old,) in conn.execute("SELECT path FROM dirs WHERE parent = ?", (path,)).fetchall():
+                    if old not in present:
+                        stats["removed"] += self._remove_tree(old)
+                conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+                conn.executemany("INSERT INTO files VALUES (?, ?, ?)",
+                                 ((path, name, size) for name, size in files))
+                # mtime взят до чтения: изменение во время чтения увидит следующий update
+                conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)",
+                             (path, parent, mtime, len(files), sum(size for _, size in files)))
+                stack.extend((sub, path) for sub in subdirs)
+        return stats
+
+    @staticmethod
+    def _read_dir(path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """Файлы (имя, размер) и подкаталоги каталога; тип — из DirEntry."""
+        files, subdirs = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        files.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+                except OSError:  # запись исчезла во время чтения
+                    continue
+        return files, subdirs
+
+    def _remove_tree(self, path: str) -> int:
+        """Удаляет каталог и его поддерево из индекса; возвращает число каталогов."""
+        low, high = _subtree_bounds(path)
+        removed = self.conn.execute(
+            "DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high)).rowcount
+        self.conn.execute("DELETE FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)", (path, low, high))
+        return removed
+
+    # ---------------- Запросы ----------------
+
+    def _subtree(self, column: str, path: str) -> Tuple[str, tuple]:
+        path = os.path.abspath(path)
+        low, high = _subtree_bounds(path)
+        return f"({column} = ? OR ({column} >= ? AND {column} < ?))", (path, low, high)
+
+    def size(self, path: str) -> int:
+        """Суммарный размер файлов в поддереве path (байт). O(число каталогов поддерева)"""
+        where, params = self._subtree("path", path)
+        return self.conn.execute(f"SELECT COALESCE(SUM(bytes), 0) FROM dirs WHERE {where}", params).fetchone()[0]
+
+    def count(self, path: str) -> Tuple[int, int]:
+        """(число файлов, число подкаталогов) в поддереве path."""
+        where, params = self._subtree("path", path)
+        files, dirs = self.conn.execute(
+            f"SELECT COALESCE(SUM(files), 0), COUNT(*) FROM dirs WHERE {where}", params).fetchone()
+        return files, max(dirs - 1, 0)  # сам path не считается
+
+    def glob(self, pattern: str, path: Optional[str] = None) -> List[str]:
+        """
+        Пути файлов, имя которых совпадает с pattern (синтаксис GLOB SQLite:
+        *, ?, [...], с учётом регистра), при необходимости — только в поддереве path.
+        """
+        sql = "SELECT dir, name FROM files WHERE name GLOB ?"
+        params: tuple = (pattern,)
+        if path is not None:
+            where, subtree = self._subtree("dir", path)
+            sql += f" AND {where}"
+            params += subtree
+        return [os.path.join(d, name) for d, name in self.conn.execute(sql + " ORDER BY dir, name", params)]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import time
+    from fs_walk import disk_usage
+
+    base = tempfile.mkdtemp(prefix="fs_index_")
+    level = [base]
+    for _ in range(4):
+        level = [os.path.join(d, f"dir{i}") for d in level for i in range(6)]
+        for d in level:
+            os.mkdir(d)
+    for d, _, _ in os.walk(base):
+        for i in range(12):
+            with open(os.path.join(d, f"file{i}.{'py' if i % 3 == 0 else 'txt'}"), "wb") as f:
+                f.write(b"x" * i)
+    db = os.path.join(tempfile.gettempdir(), "fs_index_demo.sqlite")
+    if os.path.exists(db):
+        os.remove(db)
+
+    with FsIndex(db) as index:
+        def timed(f):
+            start = time.perf_counter()
+            result = f()
+            return result, time.perf_counter() - start
+
+        first, t_first = timed(lambda: index.update(base))
+        again, t_again = timed(lambda: index.update(base))
+        assert again["scanned"] == 0 and again["unchanged"] == first["scanned"]
+
+        usage = disk_usage(base, workers=1)
+        sub = os.path.join(base, "dir3")
+        assert index.size(base) == usage[base].total_bytes
+        assert index.count(sub) == (usage[sub].total_files, usage[sub].total_dirs)
+        assert len(index.glob("*.py", sub)) == usage[sub].total_files // 3
+
+        # изменения: новый файл в глубоком каталоге и удалённое поддерево
+        deep = os.path.join(base, "dir1", "dir2", "dir3")
+        with open(os.path.join(deep, "new.py"), "wb") as f:
+            f.write(b"y" * 100)
+        shutil.rmtree(os.path.join(base, "dir5"))
+        changed, t_changed = timed(lambda: index.update(base))
+        assert changed["scanned"] == 2  # deep и base
+        usage = disk_usage(base, workers=1)
+        assert index.size(base) == usage[base].total_bytes
+        assert index.count(base) == (usage[base].total_files, usage[base].total_dirs)
+        assert os.path.join(deep, "new.py") in index.glob("new*")
+        print("Все тесты успешно пройдены.")
+
+        _, t_walk = timed(lambda: disk_usage(base, workers=1))
+        _, t_query = timed(lambda: (index.size(base), index.count(base)))
+        print(f"Первое построение: {t_first:.3f} с ({first['scanned']} каталогов)")
+        print(f"Повторный update без изменений: {t_again:.3f} с, после изменений: {t_changed:.3f} с {changed}")
+        print(f"Размер дерева: обход disk_usage {t_walk:.3f} с, запрос к индексу {t_query * 1000:.2f} мс")
+    os.remove(db)
+    shutil.rmtree(base)
@@ -0,0 +1,232 @@
+"""
+memo_cache.py
+Ограниченная, инструментированная и (по желанию) сохраняемая на диск мемоизация.
+
+@lru_cache(maxsize=None) растёт без ограничений в долгоживущем процессе и
+теряет всё при перезапуске. Декоратор memoize добавляет:
+- вытеснение по LRU (maxsize записей) и по времени жизни (ttl, секунды);
+- бюджет памяти в байтах (оценка через sys.getsizeof ключа и значения);
+- статистику: попадания, промахи, вытеснения, истёкшие записи;
+- необязательное хранилище SQLite (path=...), чтобы дорогие результаты
+  переживали перезапуск процесса.
+
+Интерфейс совместим с lru_cache: cache_info() и cache_clear().
+Кэш не потокобезопасен — как и сами рекурсивные функции лабораторной.
+"""
+
+import atexit
+import functools
+import pickle
+import sqlite3
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Optional
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions expired currsize maxsize bytes max_bytes disk_hits")
+
+_KWARGS_MARK = object()
+_MISSING = object()
+
+
+def _make_key(args, kwargs):
+    """Ключ кэша: кортеж аргументов (именованные — отсортированы после маркера).
+    Единственный аргумент int/str используется как ключ напрямую (в wrapper).
+    """
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+class SqliteBackend:
+    """Хранилище результатов в SQLite: таблица (namespace, key, value, expires).
+    Записи фиксируются пачками по commit_every и при выходе из процесса.
+    """
+
+    def __init__(self, path: str, namespace: str, commit_every: int = 256):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS memo ("
+            " namespace TEXT, key BLOB, value BLOB, expires REAL,"
+            " PRIMARY KEY (namespace, key))")
+        self.namespace = namespace
+        self.commit_every = commit_every
+        self._pending = 0
+        atexit.register(self.close)
+
+    def get(self, key) -> Any:
+        row = self.conn.execute(
+            "SELECT value, expires FROM memo WHERE namespace = ? AND key = ?",
+            (self.namespace, pickle.dumps(key))).fetchone()
+        if row is None:
+            return _MISSING
+        value, expires = row
+        if expires is not None and expires < time.time():
+            return _MISSING
+        return pickle.loads(value)
+
+    def set(self, key, value, ttl: Optional[float]) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        self.conn.execute(
+            "INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?)",
+            (self.namespace, pickle.dumps(key), pickle.dumps(value), expires))
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def clear(self) -> None:
+        self.conn.execute("DELETE FROM memo WHERE namespace = ?", (self.namespace,))
+        self.flush()
+
+    def flush(self) -> None:
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            self.conn.close()
+        except sqlite3.ProgrammingError:  # уже закрыто
+            pass
+
+
+def memoize(maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+            max_bytes: Optional[int] = None, path: Optional[str] = None) -> Callable:
+    """Декоратор мемоизации.
+
+    :param maxsize: максимум записей в памяти (None — без ограничения)
+    :param ttl: время жизни записи в секундах (None — бессрочно)
+    :param max_bytes: бюджет памяти в байтах (None — без ограничения)
+    :param path: файл SQLite для сохранения результатов между запусками
+
+    Попадание в памяти — O(1); запись с вытеснением — O(1) амортизированно.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = OrderedDict()  # ключ -> (значение, момент истечения или None, размер)
+        cache_get, move_to_end = cache.get, cache.move_to_end
+        hits = misses = evictions = expired = used_bytes = disk_hits = 0
+        backend = None
+        if path is not None:
+            backend = SqliteBackend(path, f"{func.__module__}.{func.__qualname__}")
+        clock = time.monotonic
+
+        def store(key, value):
+            nonlocal used_bytes, evictions
+            size = sys.getsizeof(key) + sys.getsizeof(value) if max_bytes is not None else 0
+            if max_bytes is not None and size > max_bytes:
+                return  # запись больше всего бюджета — в памяти не храним
+            cache[key] = (value, clock() + ttl if ttl is not None else None, size)
+            used_bytes += size
+            while (maxsize is not None and len(cache) > maxsize) or \
+                    (max_bytes is not None and used_bytes > max_bytes):
+                _, (_, _, evicted_size) = cache.popitem(last=False)
+                used_bytes -= evicted_size
+                evictions += 1
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal hits, misses, expired, used_bytes, disk_hits
+            if not kwargs and len(args) == 1 and type(args[0]) in (int, str):
+                key = args[0]
+            else:
+                key = _make_key(args, kwargs)
+            entry = cache_get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > clock():
+                    move_to_end(key)
+                    hits += 1
+                    return entry[0]
+                del cache[key]
+                used_bytes -= entry[2]
+                expired += 1
+            if backend is not None:
+                value = backend.get(key)
+                if value is not _MISSING:
+                    disk_hits += 1
+                    store(key, value)
+                    return value
+            misses += 1
+            value = func(*args, **kwargs)
+            store(key, value)
+            if backend is not None:
+                backend.set(key, value, ttl)
+            return value
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(hits, misses, evictions, expired, len(cache), maxsize,
+                             used_bytes, max_bytes, disk_hits)
+
+        def cache_clear(disk: bool = False) -> None:
+            """Очистить кэш в памяти и статистику; disk=True — и хранилище SQLite."""
+            nonlocal hits, misses, evictions, expired, used_bytes, disk_hits
+            cache.clear()
+            hits = misses = evictions = expired = used_bytes = disk_hits = 0
+            if disk and backend is not None:
+                backend.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_backend = backend
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import timeit
+
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    for x in (1, 2, 1, 3, 2):
+        square(x)
+    assert calls == [1, 2, 3, 2]  # 2 вытеснен тройкой (LRU)
+    assert square.cache_info().evictions == 2
+
+    @memoize(maxsize=None, ttl=0.01)
+    def stamp(x):
+        return time.monotonic()
+
+    first = stamp(1)
+    time.sleep(0.02)
+    assert stamp(1) != first and stamp.cache_info().expired == 1
+
+    db = os.path.join(tempfile.gettempdir(), "memo_cache_demo.sqlite")
+    if os.path.exists(db):
+        os.remove(db)
+
+    @memoize(path=db)
+    def slow(x):
+        return x + 1
+
+    slow(41)
+    slow.cache_backend.flush()
+    slow.cache_clear()
+    assert slow(41) == 42 and slow.cache_info().disk_hits == 1
+    print("Все тесты успешно пройдены.")
+
+    # Задержка попадания: memoize против functools.lru_cache
+    @functools.lru_cache(maxsize=128)
+    def lru_ident(x):
+        return x
+
+    @memoize(maxsize=128)
+    def memo_ident(x):
+        return x
+
+    @memoize(maxsize=128, ttl=60, max_bytes=1 << 20)
+    def memo_full(x):
+        return x
+
+    baseline = None
+    for f in (lru_ident, memo_ident, memo_full):
+        f(7)
+        per_call = min(timeit.repeat(lambda: f(7), number=10 ** 5, repeat=5)) / 10 ** 5
+        baseline = baseline or per_call
+        print(f"{f.__name__:>10}: попадание {per_call * 1e9:.0f} нс (x{per_call / baseline:.1f} к lru_cache)")
@@ -4,18 +4,15 @@ memoization.py
 и инструмент сравнения времени работы + построение графиков.
 """
 
-from functools import lru_cache
 import time
 import matplotlib.pyplot as plt
-
-call_count = 0
+from memo_cache import memoize
+from recursion_profiler import RecursionProfiler
 
 
 #   НАИВНАЯ РЕКУРСИЯ
 def fib_naive_count(n: int) -> int:
-    """Наивная рекурсивная версия с подсчётом вызовов."""
-    global call_count
-    call_count += 1
+    """Наивная рекурсивная версия. Вызовы считает measure через RecursionProfiler."""
     if n < 0:
         raise ValueError("n должно быть неотрицательным")
     if n == 0:
@@ -25,16 +22,13 @@ def fib_naive_count(n: int) -> int:
     return fib_naive_count(n - 1) + fib_naive_count(n - 2)
 
 
-def reset_count():
-    """Сброс счётчика вызовов."""
-    global call_count
-    call_count = 0
-
-
 #   МЕМОИЗИРОВАННАЯ РЕАЛИЗАЦИЯ
-@lru_cache(maxsize=None)
+@memoize(maxsize=1024)
 def fib_memoized(n: int) -> int:
-    """Мемоизированная версия вычисления Фибоначчи."""
+    """Мемоизированная версия вычисления Фибоначчи.
+    Кэш ограничен 1024 записями (LRU): при спуске fib(n-1) заполняет кэш,
+    а fib(n-2) сразу после этого находит свежую запись.
+    """
     if n < 0:
         raise ValueError("n должно быть неотрицательным")
     if n == 0:
@@ -45,14 +39,24 @@ def fib_memoized(n: int) -> int:
 
 
 #   ИЗМЕРЕНИЕ ВРЕМЕНИ
-def measure(func, n: int):
-    """Возвращает (результат, время, число вызовов)."""
-    global call_count
-    reset_count()
+def measure(func, n: int, count_calls: bool = True):
+    """Возвращает (результат, время, число вызовов).
+    Время меряется на функции без обёрток; вызовы (включая попадания в кэш
+    у мемоизированной версии) считаются отдельным запуском под профилировщиком.
+    count_calls=False — только время, число вызовов None.
+    """
     start = time.perf_counter()
     result = func(n)
     end = time.perf_counter()
-    return result, end - start, call_count
+    calls = None
+    if count_calls:
+        if hasattr(func, "cache_clear"):
+            func.cache_clear()
+        profiler = RecursionProfiler(mode="calls")
+        with profiler.patch(func):
+            profiler.wrap(func)(n)  # внешний вызов тоже идёт через обёртку
+        calls = profiler.calls(func)
+    return result, end - start, calls
 
 
 #   ПОСТРОЕНИЕ ГРАФИКА
@@ -97,9 +101,9 @@ if __name__ == "__main__":
 
     for n in test_ns:
         print(f"n={n}: замеры...")
-        _, t_naive, _ = measure(fib_naive_count, n)
+        _, t_naive, _ = measure(fib_naive_count, n, count_calls=False)
         fib_memoized.cache_clear()
-        _, t_memo, _ = measure(fib_memoized, n)
+        _, t_memo, _ = measure(fib_memoized, n, count_calls=False)
         naive_times.append(t_naive)
         memo_times.append(t_memo)
 
@@ -4,8 +4,19 @@ recursion.py
 - factorial(n)
 - fib(n)
 - pow_fast(a, n)
+- factorial_fast(n), factorial_swing(n) — факториал больших n без рекурсии
+- binomials(pairs) — пакетное вычисление биномиальных коэффициентов
+- power(x, n, mul, identity) — итеративное возведение в степень в любом моноиде
 """
 
+import math
+from bisect import bisect_right
+from operator import mul
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+_numpy = None  # модуль numpy, False — не установлен, None — ещё не загружали
+
+
 def factorial(n: int) -> int:
     """
     Возвращает n! (факториал числа n).
@@ -65,3 +76,430 @@ def pow_fast(a: float, n: int) -> float:
         return half * half
     else:
         return half * half * a
+
+
+# ---------------- Факториал больших чисел ----------------
+#
+# factorial(n) умножает по одному множителю: при n ~ 1000 падает с RecursionError,
+# а произведение слева направо умножает растущее число на маленькое n раз —
+# суммарно O(n^2) по размеру больших чисел. Дерево произведений (binary
+# splitting) умножает числа сопоставимой длины, и CPython применяет к ним
+# умножение Карацубы.
+
+SMALL_PRODUCT = 64  # меньшие диапазоны множим подряд: числа ещё короткие
+
+
+def _product(values: List[int]) -> int:
+    """Произведение списка через дерево попарных умножений (итеративно).
+    Каждый уровень — один проход map(mul) в C. O(M(N) log n), где N — длина
+    результата в битах, M — стоимость умножения.
+    """
+    while len(values) > 1:
+        if len(values) & 1:
+            values.append(1)
+        values = list(map(mul, values[::2], values[1::2]))
+    return values[0] if values else 1
+
+
+def _range_product(lo: int, hi: int) -> int:
+    """Произведение lo * (lo+1) * ... * hi; 1 при lo > hi."""
+    if hi - lo < SMALL_PRODUCT:
+        result = 1
+        for k in range(lo, hi + 1):
+            result *= k
+        return result
+    return _product(list(range(lo, hi + 1)))
+
+
+def factorial_fast(n: int) -> int:
+    """
+    n! через дерево произведений, без рекурсии.
+    Множитель 2^(n - popcount(n)) выделяется и добавляется одним сдвигом:
+    в дереве остаются только нечётные части чисел 1..n.
+    Временная сложность: O(M(n log n) log n); память: O(n) множителей.
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    # n! = 2^e * произведение нечётных частей. Нечётная часть k*2^j — нечётное
+    # число <= n >> j, поэтому нечётные из (n >> (i+1), n >> i] входят i+1 раз:
+    # идём от малых отрезков к большим, накапливая acc = произведение отрезков.
+    twos = n - bin(n).count("1")
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n >>= 1
+    acc = result = 1
+    for m in reversed(chain):
+        acc *= _product(list(range((m >> 1) + 1 | 1, m + 1, 2)))
+        result *= acc
+    return result << twos
+
+
+def _primes_upto(n: int) -> List[int]:
+    """Решето Эратосфена. O(n log log n), память O(n) байт."""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p, is_prime in enumerate(sieve) if is_prime]
+
+
+def _swing(m: int, primes: List[int]) -> int:
+    """
+    «Качание» m≀ = m! / ((m//2)!)^2 через разложение на простые.
+    Показатель p в m≀ — число нечётных floor(m / p^i); для p > sqrt(m) это
+    просто (m // p) & 1, поэтому большинство простых дают 0 или 1.
+    """
+    factors = []
+    root = math.isqrt(m)
+    count = bisect_right(primes, m)
+    for p in primes[:bisect_right(primes, root)]:
+        q, power = m, 1
+        while True:
+            q //= p
+            if not q:
+                break
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    # простые из (m/2, m] входят ровно один раз, из (m/3, m/2] — ни разу, ...
+    factors.extend(p for p in primes[bisect_right(primes, root):count] if (m // p) & 1)
+    return _product(factors)
+
+
+def factorial_swing(n: int) -> int:
+    """
+    n! по алгоритму Шёнхаге «prime swing»: n! = ((n//2)!)^2 * n≀.
+    Итеративно от малых m к n: возведение в квадрат + одно умножение на шаг.
+    Число простых множителей — O(n / log n) вместо n, поэтому дерево меньше.
+    Временная сложность: O(M(n log n) log n); память: O(n) байт под решето.
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    primes = _primes_upto(n)
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n >>= 1
+    result = 1
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+LEGENDRE_FRACTION = 8  # путь Лежандра — при k >= n / 8
+
+
+def _use_legendre(n: int, k: int) -> bool:
+    return k > SMALL_PRODUCT and k * LEGENDRE_FRACTION >= n
+
+
+def binomials(pairs: Iterable[Tuple[int, int]]) -> List[int]:
+    """
+    Пакетное вычисление C(n, k) для пар (n, k).
+    Если k мало относительно n (k < n / LEGENDRE_FRACTION) — произведение
+    n-k+1..n деревом, делённое на k!: O(k) множителей, решето не нужно.
+    Если k — заметная доля n — разложение по Лежандру без деления:
+    показатель p = sum(floor(n/p^i) - floor(k/p^i) - floor((n-k)/p^i)).
+    Решето простых строится один раз для всего пакета и только до наибольшего
+    n среди пар, которым нужен путь Лежандра (O(n) памяти).
+    """
+    pairs = [(n, min(k, n - k)) if 0 <= k <= n else (n, -1) for n, k in pairs]
+    if any(n < 0 for n, _ in pairs):
+        raise ValueError("n должно быть неотрицательным")
+    legendre = [n for n, k in pairs if _use_legendre(n, k)]
+    primes = _primes_upto(max(legendre)) if legendre else []
+    results = []
+    for n, k in pairs:
+        if k < 0:
+            results.append(0)
+        elif _use_legendre(n, k):
+            results.append(_binomial_legendre(n, k, primes))
+        else:
+            results.append(_range_product(n - k + 1, n) // factorial_fast(k))
+    return results
+
+
+def _binomial_legendre(n: int, k: int, primes: List[int]) -> int:
+    """C(n, k) как произведение простых в степенях (k <= n - k)."""
+    factors = []
+    root = math.isqrt(n)
+    r = n - k
+    for p in primes[:bisect_right(primes, root)]:
+        exponent, a, b, c = 0, n, k, r
+        while a:
+            a //= p
+            b //= p
+            c //= p
+            exponent += a - b - c
+        if exponent:
+            factors.append(p ** exponent)
+    # для p > sqrt(n) показатель — одно слагаемое 0 или 1;
+    # простые из (n-k, n] входят все, из (n/2, n-k] — ни одно
+    half = bisect_right(primes, n >> 1)
+    factors.extend(p for p in primes[bisect_right(primes, root):half] if n // p - k // p - r // p)
+    factors.extend(primes[bisect_right(primes, r):bisect_right(primes, n)])
+    return _product(factors)
+
+
+def binomial(n: int, k: int) -> int:
+    """C(n, k) — один элемент binomials."""
+    return binomials([(n, k)])[0]
+
+
+# ---------------- Возведение в степень в моноиде ----------------
+#
+# pow_fast рекурсивен и работает только с float. power принимает любую
+# ассоциативную операцию mul с единицей identity: целые по модулю, квадратные
+# матрицы (линейные рекуррентности), многочлены и т.п. Единица умножается
+# только при n == 0 — для матриц это экономит одно умножение.
+
+WINDOW_THRESHOLD = 64  # начиная с этой длины показателя — скользящее окно
+_mul = mul  # имя mul занято параметром power
+
+
+def _window_width(bits: int) -> int:
+    """Ширина окна, минимизирующая число умножений для показателя из bits бит."""
+    for width, limit in ((3, 240), (4, 800), (5, 2000)):
+        if bits <= limit:
+            return width
+    return 6
+
+
+def _power_binary(x, n: int, mul: Callable):
+    """Двоичный метод справа налево: O(log n) умножений."""
+    result = None
+    while True:
+        if n & 1:
+            result = x if result is None else mul(result, x)
+        n >>= 1
+        if not n:
+            return result
+        x = mul(x, x)
+
+
+def _power_window(x, n: int, mul: Callable, width: int):
+    """
+    Скользящее окно слева направо: заранее считаются нечётные степени
+    x, x^3, ..., x^(2^width - 1); затем на каждое окно — одно умножение.
+    Умножений: log n возведений в квадрат + ~log n / (width + 1) + 2^(width-1).
+    """
+    x2 = mul(x, x)
+    odd = [x]
+    for _ in range((1 << (width - 1)) - 1):
+        odd.append(mul(odd[-1], x2))
+    result = None
+    i = n.bit_length() - 1
+    while i >= 0:
+        if not (n >> i) & 1:
+            result = mul(result, result)
+            i -= 1
+            continue
+        j = max(i - width + 1, 0)
+        while not (n >> j) & 1:  # окно заканчивается единичным битом
+            j += 1
+        if result is not None:
+            for _ in range(i - j + 1):
+                result = mul(result, result)
+            window = (n >> j) & ((1 << (i - j + 1)) - 1)
+            result = mul(result, odd[window >> 1])
+        else:
+            result = odd[(n >> j) >> 1]
+        i = j - 1
+    return result
+
+
+def power(x, n: int, mul: Optional[Callable] = None, identity: Any = 1,
+          mod: Optional[int] = None):
+    """
+    x^n для ассоциативной операции mul с единицей identity, без рекурсии.
+    - mul=None: обычное умножение; с mod — встроенный pow(x, n, mod) (быстрый путь
+      для целых по модулю, реализован в C);
+    - для своих типов приведение по модулю выполняет сама mul
+      (например, functools.partial(mat_mul, mod=m));
+    - при n >= 2^WINDOW_THRESHOLD используется скользящее окно.
+    Временная сложность: O(log n) умножений; глубина рекурсии: 0.
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным (обратный элемент в моноиде не определён)")
+    if mul is None:
+        if mod is not None:
+            return pow(x, n, mod)
+        mul = _mul
+    elif mod is not None:
+        raise ValueError("mod применяется только к встроенному умножению; для своей mul приводите по модулю внутри неё")
+    if n == 0:
+        return identity
+    bits = n.bit_length()
+    if bits < WINDOW_THRESHOLD:
+        return _power_binary(x, n, mul)
+    return _power_window(x, n, mul, _window_width(bits))
+
+
+def power_many(x, exponents: Iterable[int], mul: Callable = _mul, identity: Any = 1) -> List[Any]:
+    """
+    Степени одного основания для многих показателей: квадраты x^(2^i) считаются
+    один раз и переиспользуются всеми показателями.
+    Временная сложность: O(B + sum popcount(n)) умножений, B — длина наибольшего показателя.
+    """
+    exponents = list(exponents)
+    if any(n < 0 for n in exponents):
+        raise ValueError("показатели должны быть неотрицательными")
+    squares = [x]
+    for _ in range(max(exponents, default=0).bit_length() - 1):
+        squares.append(mul(squares[-1], squares[-1]))
+    results = []
+    for n in exponents:
+        result = None
+        i = 0
+        while n:
+            if n & 1:
+                result = squares[i] if result is None else mul(result, squares[i])
+            n >>= 1
+            i += 1
+        results.append(identity if result is None else result)
+    return results
+
+
+def mat_mul(a: Sequence[Sequence[int]], b: Sequence[Sequence[int]], mod: int = 0) -> tuple:
+    """Произведение матриц (кортежи строк); mod > 0 — по модулю. O(k^3)"""
+    cols = list(zip(*b))
+    if mod:
+        return tuple(tuple(sum(map(_mul, row, col)) % mod for col in cols) for row in a)
+    return tuple(tuple(sum(map(_mul, row, col)) for col in cols) for row in a)
+
+
+def mat_identity(k: int) -> tuple:
+    """Единичная матрица k×k — identity для mat_mul."""
+    return tuple(tuple(int(i == j) for j in range(k)) for i in range(k))
+
+
+def _load_numpy():
+    """NumPy загружается при первом вызове power_array, а не при импорте
+    модуля: факториалы и power им не пользуются.
+    NumPy необязателен: без него power_array считает поэлементно через pow.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def power_array(bases, n: int, mod: Optional[int] = None):
+    """
+    Возводит весь массив оснований в одну степень n (векторно, через NumPy).
+    - С mod — двоичный метод над int64 с приведением после каждого умножения,
+      поэтому mod должен быть меньше 2^31 (произведения помещаются в int64).
+    - Без mod целые основания возводятся в массиве dtype=object: результат —
+      точные большие числа, как и без NumPy (int64 молча переполнился бы).
+      Вещественные основания — np.power над float64.
+    Без NumPy возвращает список, посчитанный поэлементно; значения совпадают.
+    Временная сложность: O(len(bases) · log n) умножений.
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if mod is not None and not 0 < mod < 1 << 31:
+        raise ValueError("mod должен быть в диапазоне 1..2^31-1")
+    np = _load_numpy()
+    if np is None:
+        return [pow(int(b), n, mod) if mod is not None else b ** n for b in bases]
+    a = np.asarray(bases)
+    if mod is None:
+        if a.dtype.kind in "iub" or a.dtype == object:
+            return np.power(a.astype(object), n)
+        return np.power(a, n)
+    if a.dtype == object:  # большие целые: приводим по модулю до перехода к int64
+        a = a % mod
+    a = a.astype(np.int64) % mod
+    result = np.full(a.shape, 1 % mod, dtype=np.int64)
+    while n:
+        if n & 1:
+            result = result * a % mod
+        n >>= 1
+        if n:
+            a = a * a % mod
+    return result
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Сверка с math.factorial / math.comb
+    for n in list(range(200)) + [1000, 4097, 65536, 100003]:
+        expected = math.factorial(n)
+        assert factorial_fast(n) == expected, n
+        assert factorial_swing(n) == expected, n
+    for n in range(200):
+        assert factorial(n) == math.factorial(n)
+    pairs = [(n, random.randint(-2, n + 2)) for n in (random.randint(0, 3000) for _ in range(300))]
+    assert binomials(pairs) == [math.comb(n, k) if k >= 0 else 0 for n, k in pairs]
+    assert binomial(10 ** 5, 5 * 10 ** 4) == math.comb(10 ** 5, 5 * 10 ** 4)
+    assert binomial(10 ** 9, 1000) == math.comb(10 ** 9, 1000)  # без решета до 10^9
+    print("Все тесты успешно пройдены.")
+
+    def timed(f, n):
+        start = time.perf_counter()
+        try:
+            f(n)
+        except RecursionError:
+            return "RecursionError"
+        return f"{time.perf_counter() - start:.4f} с"
+
+    print(f"{'n':>8} | {'factorial':>14} | {'factorial_fast':>14} | {'factorial_swing':>15} | {'math.factorial':>14}")
+    for n in (500, 900, 2000, 10 ** 4, 10 ** 5, 10 ** 6):
+        row = [timed(factorial, n) if n <= 10 ** 4 else "—",
+               timed(factorial_fast, n), timed(factorial_swing, n), timed(math.factorial, n)]
+        print(f"{n:>8} | {row[0]:>14} | {row[1]:>14} | {row[2]:>15} | {row[3]:>14}")
+
+    # power: сверка со встроенным pow и матричной формулой Фибоначчи
+    m = 10 ** 9 + 7
+    for n in (0, 1, 2, 5, 63, 64, 65, 1000, 10 ** 30):
+        assert power(3, n, mod=m) == pow(3, n, m)
+        assert power(3, n, lambda a, b: a * b % m) == pow(3, n, m)
+        assert power(2.0, n % 50) == pow_fast(2.0, n % 50)
+    fib_step = ((1, 1), (1, 0))
+
+    def mat_mod(a, b):
+        return mat_mul(a, b, m)
+
+    a, b = 0, 1
+    for _ in range(90):
+        a, b = b, a + b
+    assert power(fib_step, 90, mat_mul, mat_identity(2))[0][1] == a
+    assert power(fib_step, 10 ** 20, mat_mod, mat_identity(2)) == \
+        _power_binary(fib_step, 10 ** 20, mat_mod)
+    exps = [0, 1, 7, 100, 2 ** 70 + 3]
+    assert power_many(5, exps, lambda x, y: x * y % m) == [pow(5, e, m) for e in exps]
+    assert list(power_array([2, 3, 10], 20, mod=1000)) == [pow(b, 20, 1000) for b in (2, 3, 10)]
+    assert list(power_array([2, -3, 10 ** 20], 100, mod=m)) == [pow(b, 100, m) for b in (2, -3, 10 ** 20)]
+    assert list(power_array([2, 3], 100)) == [2 ** 100, 3 ** 100]  # без переполнения int64
+    assert list(power_array([1.5, 0.5], 3)) == [1.5 ** 3, 0.5 ** 3]
+
+    counter = [0]
+
+    def counted(a, b):
+        counter[0] += 1
+        return a * b % m
+
+    big = (1 << 4096) - 12345
+    for name, f in (("двоичный", lambda: _power_binary(3, big, counted)),
+                    ("окно", lambda: _power_window(3, big, counted, _window_width(big.bit_length())))):
+        counter[0] = 0
+        start = time.perf_counter()
+        f()
+        print(f"{name:>8}: {counter[0]} умножений, {time.perf_counter() - start:.4f} с (показатель 4096 бит)")
+    start = time.perf_counter()
+    pow(3, big, m)
+    print(f"     pow: {time.perf_counter() - start:.6f} с (встроенный быстрый путь)")
+    start = time.perf_counter()
+    power(fib_step, 10 ** 18, mat_mod, mat_identity(2))
+    print(f"F(10^18) mod p матричной степенью: {time.perf_counter() - start:.6f} с")
@@ -0,0 +1,366 @@
+"""
+recursion_profiler.py
+Профилировщик рекурсивных функций: вызовы, глубина, время, ветвление, стеки для flamegraph.
+
+Вместо ручного global call_count в коде функции профилировщик оборачивает
+функцию снаружи и собирает:
+- число вызовов и максимальную глубину рекурсии;
+- накопленное время (внешние вызовы, без двойного учёта рекурсии) и
+  собственное время (без вложенных профилируемых вызовов);
+- ветвление дерева вызовов: сколько раз вызов породил 0, 1, 2, ... детей;
+- дерево стеков, которое выгружается в формате collapsed stacks
+  ("a;b;c вес") для flamegraph.pl / speedscope.
+
+Переключение во время работы:
+- patch(func, ...) — контекстный менеджер: подменяет имя функции в её модуле
+  на обёртку и возвращает оригинал на выходе. Рекурсивные вызовы идут через
+  глобальное имя, поэтому попадают в обёртку, а вне блока накладных
+  расходов нет вовсе;
+- profile(func) — постоянная обёртка, переключаемая enable()/disable().
+  Для функций уровня модуля disable() возвращает в модуль оригинал, и
+  рекурсивные вызовы снова идут мимо обёртки. Вызовы через ссылки,
+  сохранённые раньше (from m import f, вложенные функции), по-прежнему
+  проходят через обёртку: выключенная, она стоит лишний вызов и проверку
+  флага — в fib(22) это в ~4 раза медленнее. Нулевые накладные расходы
+  гарантирует только patch().
+Обёртка добавляет кадр стека на каждый уровень рекурсии: под профилировщиком
+допустимая глубина примерно вдвое меньше sys.getrecursionlimit().
+sys.monitoring (Python 3.12+) здесь не используется: подмена имени работает
+в любой версии и при выключенном профилировании бесплатна.
+"""
+
+import functools
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+MODES = ("full", "calls")
+
+
+# узел дерева стеков: [имя, родитель, вызовы, собственное время, полное время, дети]
+NAME, PARENT, CALLS, SELF_NS, TOTAL_NS, CHILDREN = range(6)
+
+
+def _new_node(name: str, parent) -> list:
+    return [name, parent, 0, 0, 0, {}]
+
+
+class RecursionProfiler:
+    def __init__(self, mode: str = "full"):
+        """
+        :param mode: "full" — время, глубина, ветвление и дерево стеков;
+                     "calls" — только число вызовов (минимальные накладные расходы)
+        Профилировщик не потокобезопасен: стек вызовов у него один.
+        """
+        if mode not in MODES:
+            raise ValueError(f"неизвестный режим {mode!r}, ожидается один из {MODES}")
+        self.mode = mode
+        self.enabled = True
+        self.reset()
+
+        self._installed = []  # (модуль, имя, оригинал, обёртка) от profile()
+
+    def reset(self) -> None:
+        """
+        Очистить всю собранную статистику. Контейнеры очищаются на месте:
+        уже установленные обёртки держат ссылки на них в замыканиях.
+        Вызывать вне профилируемых вызовов.
+        """
+        if not hasattr(self, "_root"):
+            self._root = _new_node("", None)
+            # кадры [узел, время детей, число детей]; корневой кадр не снимается
+            self._stack: List[list] = [[self._root, 0, 0]]
+            self._calls: Dict[str, int] = {}          # только для режима "calls"
+            self._fanout: Dict[str, Counter] = {}     # имя -> {число детей: вызовов}
+            return
+        self._root[CHILDREN].clear()
+        del self._stack[1:]
+        self._stack[0][1:] = [0, 0]
+        for name in self._calls:
+            self._calls[name] = 0
+        for fanout in self._fanout.values():
+            fanout.clear()
+
+    # ---------------- Обёртки ----------------
+
+    def wrap(self, func: Callable, name: str = None) -> Callable:
+        """
+        Обёртка, записывающая вызовы func (учитывает флаг enabled).
+        В режиме "full" на вызов приходятся два замера времени и обновление
+        узла дерева стеков; глубина и итоги по функциям выводятся из дерева
+        при запросе статистики, а не считаются на каждом вызове.
+        """
+        name = name or func.__qualname__
+        prof = self
+
+        if self.mode == "calls":
+            calls = self._calls
+            calls.setdefault(name, 0)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if prof.enabled:
+                    calls[name] += 1
+                return func(*args, **kwargs)
+            return wrapper
+
+        stack = self._stack
+        push, pop = stack.append, stack.pop
+        fanout = self._fanout.setdefault(name, Counter())
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not prof.enabled:
+                return func(*args, **kwargs)
+            parent = stack[-1]
+            node = parent[0][CHILDREN].get(name)
+            if node is None:
+                node = parent[0][CHILDREN][name] = _new_node(name, parent[0])
+            frame = [node, 0, 0]
+            push(frame)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                pop()
+                node[CALLS] += 1
+                node[SELF_NS] += elapsed - frame[1]
+                node[TOTAL_NS] += elapsed
+                fanout[frame[2]] += 1
+                parent[1] += elapsed
+                parent[2] += 1
+
+        return wrapper
+
+    def profile(self, func: Callable) -> Callable:
+        """
+        Декоратор постоянного профилирования. Функция уровня модуля
+        запоминается, чтобы enable()/disable() подменяли её имя в модуле.
+        """
+        wrapper = self.wrap(func)
+        if func.__qualname__ == func.__name__ and func.__module__ in sys.modules:
+            self._installed.append((sys.modules[func.__module__], func.__name__, func, wrapper))
+        return wrapper
+
+    def _rebind(self, enabled: bool) -> None:
+        """Вернуть в модули обёртки (enabled) или оригиналы функций из profile()."""
+        for module, name, func, wrapper in self._installed:
+            current = getattr(module, name, None)
+            if current is func or current is wrapper:  # имя не переопределено кем-то ещё
+                setattr(module, name, wrapper if enabled else func)
+
+    @contextmanager
+    def patch(self, *funcs: Callable) -> Iterator["RecursionProfiler"]:
+        """
+        Временно подменяет funcs в их модулях на обёртки. Функция должна быть
+        доступна в модуле под своим именем — через него идут рекурсивные вызовы.
+        Вне блока with исходные функции работают без накладных расходов.
+        """
+        patched = []
+        try:
+            for func in funcs:
+                module = sys.modules[func.__module__]
+                if getattr(module, func.__name__, None) is not func:
+                    raise ValueError(f"{func.__module__}.{func.__name__} не ссылается на эту функцию")
+                setattr(module, func.__name__, self.wrap(func))
+                patched.append((module, func))
+            yield self
+        finally:
+            for module, func in patched:
+                setattr(module, func.__name__, func)
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._rebind(True)
+
+    def disable(self) -> None:
+        self.enabled = False
+        self._rebind(False)
+
+    # ---------------- Результаты ----------------
+
+    def _walk(self) -> Iterator[Tuple[list, int]]:
+        """Обход дерева стеков в глубину (без рекурсии): (узел, глубина имени узла на пути)."""
+        on_path = Counter()
+        stack = [(child, True) for child in self._root[CHILDREN].values()]
+        while stack:
+            node, entering = stack.pop()
+            if not entering:
+                on_path[node[NAME]] -= 1
+                continue
+            on_path[node[NAME]] += 1
+            yield node, on_path[node[NAME]]
+            stack.append((node, False))
+            stack.extend((child, True) for child in node[CHILDREN].values())
+
+    def calls(self, func) -> int:
+        """Число вызовов функции (объект функции или её qualname)."""
+        name = func if isinstance(func, str) else func.__qualname__
+        if self.mode == "calls":
+            return self._calls.get(name, 0)
+        return sum(node[CALLS] for node, _ in self._walk() if node[NAME] == name)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Статистика по функциям: {qualname: {calls, max_depth, total_s, self_s,
+        mean_fanout, fanout}}. total_s — время внешних вызовов (узлы, над которыми
+        нет той же функции), поэтому рекурсия не учитывается дважды.
+        """
+        if self.mode == "calls":
+            return {name: {"calls": calls} for name, calls in self._calls.items()}
+        result = {name: {"calls": 0, "max_depth": 0, "total_s": 0.0, "self_s": 0.0}
+                  for name in self._fanout}
+        for node, depth in self._walk():
+            s = result[node[NAME]]
+            s["calls"] += node[CALLS]
+            s["self_s"] += node[SELF_NS] / 1e9
+            s["max_depth"] = max(s["max_depth"], depth)
+            if depth == 1:
+                s["total_s"] += node[TOTAL_NS] / 1e9
+        for name, fanout in self._fanout.items():
+            calls = sum(fanout.values())
+            result[name]["mean_fanout"] = sum(k * v for k, v in fanout.items()) / calls if calls else 0.0
+            result[name]["fanout"] = dict(sorted(fanout.items()))
+        return result
+
+    def report(self) -> str:
+        """Текстовая таблица статистики (режим "full")."""
+        lines = [f"{'функция':<28} {'вызовы':>10} {'глубина':>8} {'всего, с':>10} "
+                 f"{'собств., с':>11} {'ветвление':>10}"]
+        for name, s in self.stats().items():
+            lines.append(f"{name:<28} {s['calls']:>10} {s['max_depth']:>8} {s['total_s']:>10.4f} "
+                         f"{s['self_s']:>11.4f} {s['mean_fanout']:>10.2f}")
+        return "\n".join(lines)
+
+    def collapsed(self, weight: str = "time") -> List[str]:
+        """
+        Стеки в формате collapsed: "f;f;g вес", вес — собственное время в мкс
+        (weight="time") или число вызовов (weight="calls"). Только для режима "full".
+        """
+        if weight not in ("time", "calls"):
+            raise ValueError("weight должен быть 'time' или 'calls'")
+        field, scale = (SELF_NS, 1000) if weight == "time" else (CALLS, 1)
+        lines = []
+        stack = [(child, child[NAME]) for child in self._root[CHILDREN].values()]
+        while stack:
+            node, path = stack.pop()
+            value = node[field] // scale
+            if value:
+                lines.append(f"{path} {value}")
+            stack.extend((child, f"{path};{child[NAME]}") for child in node[CHILDREN].values())
+        return lines
+
+    def write_collapsed(self, path: str, weight: str = "time") -> None:
+        """Сохранить collapsed stacks в файл (вход flamegraph.pl)."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.collapsed(weight)) + "\n")
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import recursion
+    import recursion_tasks
+
+    # Ханойские башни: 2^n - 1 перемещений раскладываются в 2^n - 1 вызовов с n >= 1
+    original = recursion_tasks.hanoi
+    prof = RecursionProfiler()
+    with prof.patch(recursion_tasks.hanoi):
+        moves = recursion_tasks.hanoi(10, "A", "C", "B")
+    stats = prof.stats()["hanoi"]
+    assert stats["max_depth"] == 10 and stats["calls"] == 2 ** 10 - 1, stats
+    assert stats["fanout"] == {0: 2 ** 9, 2: 2 ** 9 - 1}
+    assert recursion_tasks.hanoi is original  # имя возвращено после блока
+    assert len(moves) == 2 ** 10 - 1
+
+    prof = RecursionProfiler()
+    with prof.patch(recursion.fib, recursion.factorial):
+        recursion.fib(15)
+        recursion.factorial(50)
+        prof.disable()
+        recursion.fib(10)  # выключено — не учитывается
+    assert prof.calls(recursion.fib) == 1973 and prof.calls("factorial") == 50
+    assert prof.stats()["factorial"]["max_depth"] == 50
+    lines = prof.collapsed("calls")
+    assert "fib;fib 2" in lines and sum(int(line.split()[-1]) for line in lines) == 1973 + 50
+
+    counter = RecursionProfiler(mode="calls")
+    with counter.patch(recursion.fib):
+        recursion.fib(20)
+    assert counter.calls(recursion.fib) == 21891
+
+    # reset() не отрывает уже установленные обёртки от статистики
+    for mode in MODES:
+        prof = RecursionProfiler(mode)
+
+        @prof.profile
+        def countdown(n):
+            return n if n <= 0 else countdown(n - 1)
+
+        countdown(5)
+        prof.reset()
+        assert prof.calls(countdown) == 0
+        countdown(3)
+        assert prof.calls(countdown) == 4 and prof.stats()["countdown"]["calls"] == 4, mode
+    print("Все тесты успешно пройдены.")
+
+    # Профиль всех рекурсивных функций лабораторной
+    prof = RecursionProfiler()
+    with prof.patch(recursion.fib, recursion.factorial, recursion.pow_fast,
+                    recursion_tasks.hanoi, recursion_tasks.binary_search_recursive,
+                    recursion_tasks.walk_fs_recursive):
+        recursion.fib(20)
+        recursion.factorial(300)  # обёртка удваивает число кадров стека
+        recursion.pow_fast(1.0001, 10 ** 6)
+        recursion_tasks.hanoi(16, "A", "C", "B")
+        data = list(range(10 ** 5))
+        for target in range(0, 10 ** 5, 97):
+            recursion_tasks.binary_search_recursive(data, target, 0, len(data) - 1)
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                recursion_tasks.walk_fs_recursive(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            finally:
+                sys.stdout = stdout
+    print(prof.report())
+    out = os.path.join(tempfile.gettempdir(), "recursion.collapsed")
+    prof.write_collapsed(out)
+    print(f"Стеки для flamegraph: {out}")
+
+    # Накладные расходы: без профилировщика, выключенные обёртки, calls, full
+    def timed(f, n=22):
+        start = time.perf_counter()
+        f(n)
+        return time.perf_counter() - start
+
+    base = timed(recursion.fib)
+    off = RecursionProfiler()
+    off.disable()
+    with off.patch(recursion.fib):
+        t_off = timed(recursion.fib)
+    for mode in MODES:
+        with RecursionProfiler(mode).patch(recursion.fib):
+            t_mode = timed(recursion.fib)
+        print(f"fib(22), режим {mode:>5}: x{t_mode / base:.1f} к времени без профилировщика")
+    print(f"fib(22), выключенная обёртка внутри patch: x{t_off / base:.1f}; вне patch: x1.0")
+
+    def fib_plain(n):
+        return n if n < 2 else fib_plain(n - 1) + fib_plain(n - 2)
+
+    decorated = RecursionProfiler()
+
+    @decorated.profile
+    def fib_profiled(n):
+        return n if n < 2 else fib_profiled(n - 1) + fib_profiled(n - 2)
+
+    wrapper = fib_profiled
+    plain = timed(fib_plain)
+    decorated.disable()
+    t_rebound = timed(fib_profiled)  # в модуле снова оригинал
+    t_stale = timed(wrapper)  # внешний вызов через сохранённую обёртку
+    print(f"fib(22) с @profile после disable(): x{t_rebound / plain:.1f} по имени модуля, "
+          f"x{t_stale / plain:.1f} через сохранённую ссылку на обёртку (только внешний вызов)")
@@ -4,10 +4,12 @@ recursion_tasks.py
 - бинарный поиск (рекурсивный)
 - рекурсивный обход файловой системы
 - решение задачи «Ханойские башни»
+- итеративные ходы Ханойских башен: генератор, k-й ход, пакет в array
 """
 
 import os
-from typing import List, Tuple
+from array import array
+from typing import Iterator, List, Tuple
 
 
 def binary_search_recursive(arr, target, left, right):
@@ -65,3 +67,119 @@ def hanoi(n: int, source: str, target: str, aux: str) -> List[Tuple[int, str, st
     moves.append((n, source, target))
     moves += hanoi(n - 1, aux, target, source)
     return moves
+
+
+# ---------------- Ханойские башни без рекурсии ----------------
+#
+# hanoi склеивает списки на каждом уровне (moves += ...): O(n·2^n) копирований
+# и все 2^n - 1 ходов в памяти. Ход с номером k (1..2^n - 1) определяется
+# двоичной записью k:
+# - диск — число младших нулей k плюс 1;
+# - откуда — (k & (k-1)) % 3, куда — ((k | (k-1)) + 1) % 3 в нумерации колышков,
+#   где цель — колышек 2 при нечётном n и колышек 1 при чётном.
+
+HANOI_MAX_DISK = (1 << 12) - 1  # ход в array('H'): (диск << 4) | (откуда << 2) | куда
+
+
+def _hanoi_pegs(n: int, source, target, aux) -> tuple:
+    """Колышки в нумерации формулы: 0 — source, цель — 2 (нечётное n) или 1."""
+    return (source, aux, target) if n & 1 else (source, target, aux)
+
+
+def hanoi_move(n: int, k: int, source: str = "A", target: str = "C",
+               aux: str = "B") -> Tuple[int, str, str]:
+    """
+    k-й ход (нумерация с 1) решения для n дисков — без перебора предыдущих.
+    Совпадает с hanoi(n, source, target, aux)[k - 1].
+    Временная сложность: O(n) битовых операций над k (k < 2^n).
+    """
+    if not 1 <= k < 1 << n:
+        raise ValueError(f"номер хода должен быть в диапазоне 1..{(1 << n) - 1}")
+    pegs = _hanoi_pegs(n, source, target, aux)
+    return (k & -k).bit_length(), pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3]
+
+
+def hanoi_array(n: int, start: int = 1, count: int = None) -> array:
+    """
+    Ходы start..start+count-1 в компактном буфере array('H'):
+    элемент — (диск << 4) | (откуда << 2) | куда, колышки 0 — source,
+    1 — aux, 2 — target. Два байта на ход вместо кортежа из трёх объектов.
+
+    Диск d ходит на шагах k = 2^(d-1)·(2j+1), и его ходы повторяются
+    с периодом 3 по j, поэтому буфер заполняется срезами с шагом 2^d:
+    n присваиваний срезов в C вместо цикла Python по ходам.
+    Временная сложность: O(count + n); память: 2·count байт.
+    """
+    if n > HANOI_MAX_DISK:
+        raise ValueError("номер диска не помещается в элемент array('H')")
+    total = (1 << n) - 1
+    if count is None:
+        count = total - start + 1
+    if start < 1 or count < 0 or start + count - 1 > total:
+        raise ValueError(f"ходы должны лежать в диапазоне 1..{total}")
+    # перестановка колышков формулы в фиксированную нумерацию (source, aux, target)
+    remap = (0, 1, 2) if n & 1 else (0, 2, 1)
+    buffer = array("H", bytes(2 * count))
+    end = start + count
+    for d in range(1, n + 1):
+        half = 1 << (d - 1)
+        step = half << 1
+        first = start + (half - start) % step  # первый ход диска d в окне
+        if first >= end:
+            continue
+        cycle = array("H", [(d << 4) | (remap[(k & (k - 1)) % 3] << 2) | remap[((k | (k - 1)) + 1) % 3]
+                            for k in (first, first + step, first + 2 * step)])
+        moves = len(range(first, end, step))
+        buffer[first - start::step] = (cycle * (moves // 3 + 1))[:moves]
+    return buffer
+
+
+def unpack_hanoi_move(code: int, source: str = "A", target: str = "C",
+                      aux: str = "B") -> Tuple[int, str, str]:
+    """Распаковка элемента hanoi_array в кортеж (диск, откуда, куда)."""
+    pegs = (source, aux, target)
+    return code >> 4, pegs[(code >> 2) & 3], pegs[code & 3]
+
+
+def hanoi_iter(n: int, source: str = "A", target: str = "C", aux: str = "B",
+               chunk: int = 1 << 16) -> Iterator[Tuple[int, str, str]]:
+    """
+    Ленивый генератор ходов в том же порядке, что и hanoi.
+    Ходы порциями берутся из hanoi_array и переводятся в кортежи по таблице.
+    Временная сложность: O(2^n); память: O(chunk) — не зависит от n.
+    """
+    pegs = (source, aux, target, None)  # код колышка 3 не встречается
+    table = [(code >> 4, pegs[(code >> 2) & 3], pegs[code & 3]) for code in range((n + 1) << 4)]
+    total = (1 << n) - 1
+    for start in range(1, total + 1, chunk):
+        yield from map(table.__getitem__, hanoi_array(n, start, min(chunk, total - start + 1)))
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    for n in range(1, 13):
+        expected = hanoi(n, "A", "C", "B")
+        assert list(hanoi_iter(n)) == expected, n
+        assert [hanoi_move(n, k) for k in range(1, 1 << n)] == expected, n
+        assert [unpack_hanoi_move(c) for c in hanoi_array(n)] == expected, n
+        if n >= 3:
+            assert [unpack_hanoi_move(c) for c in hanoi_array(n, 3, 4)] == expected[2:6], n
+    assert hanoi_move(64, (1 << 63)) == (64, "A", "C")
+    print("Все тесты успешно пройдены.")
+
+    print(f"{'n':>3} | {'hanoi':>20} | {'hanoi_iter':>20} | {'hanoi_array':>20}")
+    for n in (16, 20, 22):
+        row = []
+        for f in (lambda: hanoi(n, "A", "C", "B"), lambda: sum(1 for _ in hanoi_iter(n)),
+                  lambda: hanoi_array(n)):
+            start = time.perf_counter()
+            f()
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()  # память отдельным запуском: трассировка замедляет код
+            f()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            row.append(f"{elapsed:.2f} с, {peak / 2 ** 20:.1f} МБ")
+        print(f"{n:>3} | {row[0]:>20} | {row[1]:>20} | {row[2]:>20}")
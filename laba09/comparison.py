@@ -10,12 +10,14 @@
 Графики сохраняются в той же директории, где расположен файл.
 """
 
+import functools
 import time
+import timeit
 import tracemalloc
 import os
 import matplotlib.pyplot as plt
 
-from dynamic_programming import fib_memo, fib_iter
+from dynamic_programming import fib_memo, fib_iter, fib_fast, fib_mod, fib_many
 
 
 def measure_time_and_memory(func, *args, repeats=5):
@@ -33,6 +35,35 @@ def measure_time_and_memory(func, *args, repeats=5):
     return sum(times) / repeats, memory
 
 
+def measure_time(func, *args, repeats=5, setup=None):
+    """
+    Лучшее из repeats время вызова func(*args) без трассировки памяти:
+    tracemalloc перехватывает каждое выделение и сильно замедляет код,
+    создающий много объектов (большие числа, кэши), искажая сравнение.
+    setup вызывается перед каждым повтором вне замера (например, сброс кэша).
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_peak_memory(func, *args, setup=None):
+    """Пиковая память (байт) одного вызова func(*args) — отдельным проходом."""
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
 # ЭКСПЕРИМЕНТ: ФИБОНАЧЧИ
 
 
@@ -79,9 +110,74 @@ def fibonacci_experiment():
     print(f"График сохранён: {file_path}")
 
 
+def fast_fibonacci_experiment():
+    """
+    Сравнивает быстрое удвоение (fib_fast) с fib_memo и fib_iter
+    на больших n, а также замеряет fib_mod и пакетный fib_many.
+
+    fib_memo рекурсивен и ограничен глубиной стека, fib_iter выполняет
+    O(n) сложений больших чисел — для них берутся только посильные n.
+    """
+    memo_limit = 400       # два кадра стека на уровень (fib_memo + обёртка memoize)
+    iter_limit = 2 * 10 ** 5
+
+    funcs = ((fib_memo, memo_limit), (fib_iter, iter_limit), (fib_fast, None))
+    times, peaks = [], []
+    for n in [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]:
+        time_row, peak_row = [], []
+        for func, limit in funcs:
+            if limit is not None and n > limit:
+                time_row.append("—")
+                peak_row.append("—")
+                continue
+            # fib_memo замеряется с пустым кэшем, иначе это поиск в словаре
+            setup = fib_memo.cache_clear if func is fib_memo else None
+            t = measure_time(func, n, repeats=5 if n <= 10 ** 5 else 1, setup=setup)
+            peak = measure_peak_memory(func, n, setup=setup)
+            time_row.append(f"{t:.6f}")
+            peak_row.append(f"{peak / 1024:.1f}")
+        times.append((n, time_row))
+        peaks.append((n, peak_row))
+
+    for title, rows in (("(сек, без tracemalloc)", times), ("(пиковая память, КБ)", peaks)):
+        print(f"{'n':>10} {'fib_memo':>12} {'fib_iter':>12} {'fib_fast':>12}  {title}")
+        for n, row in rows:
+            print(f"{n:>10} " + " ".join(f"{cell:>12}" for cell in row))
+        print()
+
+    mod = 10 ** 9 + 7
+    start = time.perf_counter()
+    value = fib_mod(10 ** 9, mod)
+    print(f"F(10^9) mod {mod} = {value}, {time.perf_counter() - start:.6f} сек")
+
+    ns = list(range(10 ** 9, 10 ** 9 + 10 ** 4, 7))
+    start = time.perf_counter()
+    fib_many(ns, mod)
+    print(f"fib_many: {len(ns)} номеров около 10^9 по модулю за {time.perf_counter() - start:.4f} сек")
+
+
+def memo_hit_latency():
+    """
+    Задержка попадания в кэш fib_memo (memoize из лабораторной №3) в сравнении
+    с тем же вычислением под functools.lru_cache, реализованным на C.
+    Попадание memoize — вызов Python-обёртки, поиск в OrderedDict и перенос
+    записи в конец LRU-очереди, поэтому оно в несколько раз дороже.
+    """
+    lru_fib = functools.lru_cache(maxsize=1024)(fib_memo.__wrapped__)
+    results = {}
+    for name, func in (("lru_cache", lru_fib), ("memoize", fib_memo)):
+        func(30)  # прогрев: значение уже в кэше
+        per_call = min(timeit.repeat(lambda: func(30), number=10 ** 5, repeat=5)) / 10 ** 5
+        results[name] = per_call
+        print(f"{name:>10}: попадание {per_call * 1e9:.0f} нс")
+    print(f"memoize медленнее lru_cache в {results['memoize'] / results['lru_cache']:.1f} раза")
+
+
 # ============================================================
 # ТОЧКА ВХОДА
 # ============================================================
 
 if __name__ == "__main__":
     fibonacci_experiment()
+    fast_fibonacci_experiment()
+    memo_hit_latency()
@@ -2,7 +2,7 @@
 Модуль dynamic_programming.py
 
 Содержит классические алгоритмы динамического программирования:
-- Числа Фибоначчи (наивный, нисходящий, восходящий подходы)
+- Числа Фибоначчи (наивный, нисходящий, восходящий подходы, быстрое удвоение)
 - Задача о рюкзаке (0-1 Knapsack) с восстановлением решения
 - Наибольшая общая подпоследовательность (LCS)
 - Расстояние Левенштейна
@@ -12,7 +12,12 @@
 Все алгоритмы снабжены описанием и анализом сложности.
 """
 
-from functools import lru_cache
+import os
+import sys
+
+# общий декоратор мемоизации из лабораторной №3 (ограниченный LRU-кэш со статистикой)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "laba03"))
+from memo_cache import memoize  # noqa: E402
 
 # ЧИСЛА ФИБОНАЧЧИ
 
@@ -31,7 +36,7 @@ def fib_recursive(n: int) -> int:
     return fib_recursive(n - 1) + fib_recursive(n - 2)
 
 
-@lru_cache(None)
+@memoize(maxsize=1024)
 def fib_memo(n: int) -> int:
     """
     Вычисляет n-е число Фибоначчи с использованием нисходящего
@@ -40,6 +45,11 @@ def fib_memo(n: int) -> int:
     :param n: номер числа Фибоначчи (n >= 0)
     :return: n-е число Фибоначчи
 
+    Кэш ограничен 1024 записями: при спуске рекурсии F(k-2) запрашивается
+    сразу после вычисления F(k-1), поэтому LRU-вытеснение не мешает.
+    Обёртка memoize написана на Python и добавляет кадр стека на каждый
+    уровень рекурсии, поэтому с пустым кэшем доступны n примерно до 480.
+
     Временная сложность: O(n)
     Пространственная сложность: O(n) — кэш + стек рекурсии
     """
@@ -65,6 +75,103 @@ def fib_iter(n: int) -> int:
         a, b = b, a + b
     return b
 
+
+def _fib_pair(n: int, mod: int = 0) -> tuple:
+    """
+    Возвращает пару (F(n), F(n+1)) методом быстрого удвоения.
+
+    Биты n просматриваются от старшего к младшему; для k = текущий префикс:
+        F(2k)   = F(k) * (2F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    Если mod > 0, все вычисления ведутся по модулю mod.
+
+    Временная сложность: O(log n) умножений (больших чисел или по модулю)
+    Пространственная сложность: O(1) чисел
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast(n: int) -> int:
+    """
+    Вычисляет n-е число Фибоначчи методом быстрого удвоения (без рекурсии).
+
+    :param n: номер числа Фибоначчи (n >= 0)
+    :return: n-е число Фибоначчи
+
+    Временная сложность: O(log n) умножений больших чисел
+    (O(M(n)) с учётом роста разрядности, где M — стоимость умножения)
+    Пространственная сложность: O(n) бит для результата
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    return _fib_pair(n)[0]
+
+
+def fib_mod(n: int, mod: int) -> int:
+    """
+    Вычисляет F(n) mod m методом быстрого удвоения.
+
+    :param n: номер числа Фибоначчи (n >= 0)
+    :param mod: модуль (mod >= 1)
+    :return: F(n) по модулю mod
+
+    Временная сложность: O(log n)
+    Пространственная сложность: O(1)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if mod < 1:
+        raise ValueError("mod должен быть положительным")
+    return _fib_pair(n, mod)[0] % mod
+
+
+def fib_many(ns: list, mod: int = 0) -> list:
+    """
+    Пакетное вычисление F(n) (или F(n) mod m при mod > 0) для списка номеров.
+
+    Номера обрабатываются по возрастанию без повторов; если следующий номер
+    отстоит от предыдущего не больше чем на 2, он получается из уже известной
+    пары (F(k), F(k+1)) сложениями, иначе — быстрым удвоением.
+
+    :param ns: список номеров (каждый >= 0)
+    :param mod: модуль или 0 для точных значений
+    :return: список значений в порядке ns
+
+    Временная сложность: O(q log q + q log N), q = len(ns), N = max(ns)
+    """
+    if mod < 0:
+        raise ValueError("mod должен быть неотрицательным")
+    values = {}
+    k, pair = None, None
+    for n in sorted(set(ns)):
+        if n < 0:
+            raise ValueError("n должно быть неотрицательным")
+        if k is not None and n - k <= 2:
+            a, b = pair
+            while k < n:
+                a, b = b, a + b
+                if mod:
+                    b %= mod
+                k += 1
+            pair = (a, b)
+        else:
+            k, pair = n, _fib_pair(n, mod)
+        values[n] = pair[0] % mod if mod else pair[0]
+    return [values[n] for n in ns]
+
 # ЗАДАЧА О РЮКЗАКЕ (0-1 KNAPSACK)
 
 def knapsack(weights: list, values: list, capacity: int) -> list: